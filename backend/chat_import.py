@@ -4,10 +4,10 @@ Local chat log import utilities for offline VOD analysis.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from backend import json_codec
 from backend.vod_models import ChatMessage
 
 
@@ -36,15 +36,15 @@ def _parse_chat_obj(obj: dict[str, Any], idx: int) -> ChatMessage:
         raise ValueError(f"chat record at index {idx} is invalid: {exc}") from exc
 
 
-def _load_jsonl_messages(text: str) -> list[ChatMessage]:
+def _load_jsonl_messages(data: bytes) -> list[ChatMessage]:
     messages: list[ChatMessage] = []
-    for line_no, line in enumerate(text.splitlines(), start=1):
+    for line_no, line in enumerate(data.splitlines(), start=1):
         stripped = line.strip()
         if not stripped:
             continue
         try:
-            parsed = json.loads(stripped)
-        except json.JSONDecodeError as exc:
+            parsed = json_codec.loads(stripped)
+        except json_codec.JSONDecodeError as exc:
             raise ValueError(f"invalid JSON on line {line_no}: {exc.msg}") from exc
         if not isinstance(parsed, dict):
             raise ValueError(f"line {line_no} must be a JSON object")
@@ -52,10 +52,10 @@ def _load_jsonl_messages(text: str) -> list[ChatMessage]:
     return messages
 
 
-def _load_json_array_messages(text: str) -> list[ChatMessage]:
+def _load_json_array_messages(data: bytes) -> list[ChatMessage]:
     try:
-        parsed_json = json.loads(text)
-    except json.JSONDecodeError as exc:
+        parsed_json = json_codec.loads(data)
+    except json_codec.JSONDecodeError as exc:
         raise ValueError(f"invalid JSON: {exc.msg}") from exc
 
     if not isinstance(parsed_json, list):
@@ -78,11 +78,13 @@ def load_chat_messages(path: str) -> list[ChatMessage]:
     if suffix not in {".jsonl", ".json"}:
         raise ValueError("unsupported chat file extension; expected .jsonl or .json")
 
-    text = file_path.read_text(encoding="utf-8")
-    if text.strip() == "":
+    # Parse raw bytes: json_codec (orjson when installed) decodes UTF-8 itself, so the
+    # file is never materialized as a decoded str first.
+    data = file_path.read_bytes()
+    if not data.strip():
         return []
 
     if suffix == ".jsonl":
-        return _load_jsonl_messages(text)
+        return _load_jsonl_messages(data)
 
-    return _load_json_array_messages(text)
+    return _load_json_array_messages(data)
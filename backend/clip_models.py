@@ -6,12 +6,19 @@ Pre-download: ClipRef. Post-download: ClipAsset.
 
 from __future__ import annotations
 
-import json
-import re
+import os
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
+from urllib.parse import urlparse, urlunparse
+
+from backend import json_codec
+
+
+_VIEW_SUFFIX_MULTIPLIERS = {"K": 1000, "M": 1_000_000}
 
 
 def parse_views(text: str) -> Optional[int]:
@@ -24,25 +31,77 @@ def parse_views(text: str) -> Optional[int]:
         "2.5M" -> 2500000
         "" -> None
     """
-    if not text or not text.strip():
+    if not text:
         return None
-    text = text.strip().upper().replace(",", "")
-    match = re.match(r"^([\d.]+)\s*([KM])?$", text)
-    if not match:
+    return _parse_views_cached(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_views_cached(text: str) -> Optional[int]:
+    """Memoized parse; listings repeat the same rounded counts ("1.2K") across clips."""
+    normalized = text.strip().upper().replace(",", "")
+    multiplier = _VIEW_SUFFIX_MULTIPLIERS.get(normalized[-1:], 1)
+    if multiplier != 1:
+        normalized = normalized[:-1].rstrip()
+    # Only digits and dots are accepted (float() alone would also take "inf", "1e3", "-5").
+    if not normalized.replace(".", "").isdecimal():
         return None
-    num_str, suffix = match.groups()
     try:
-        value = float(num_str)
+        value = float(normalized)
     except ValueError:
         return None
-    if suffix == "K":
-        value *= 1000
-    elif suffix == "M":
-        value *= 1_000_000
-    return int(value)
+    return int(value * multiplier)
+
+
+# URL helpers are pure and called for every clip on each filter pass; memoize them.
+_URL_CACHE_SIZE = 1 << 16
 
 
-@dataclass
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def normalize_clip_url(url: str) -> str:
+    """
+    Normalize a clip URL for comparison.
+
+    Lowercases the scheme; removes query params (?...), ;params and trailing slash.
+    """
+    # Fast path for the usual lowercase http(s) URL without ;params: slicing at the
+    # first '?'/'#' matches urlparse and avoids building and re-joining a ParseResult.
+    end = len(url)
+    for sep in "?#":
+        idx = url.find(sep, 0, end)
+        if idx != -1:
+            end = idx
+    head = url[:end]
+    if head.startswith(("https://", "http://")) and ";" not in head:
+        host_start = head.index("//") + 2
+        if head[host_start : host_start + 1] not in ("", "/"):
+            return head.rstrip("/")
+    if not url:
+        return url
+    parsed = urlparse(url)
+    return urlunparse((parsed.scheme, parsed.netloc, parsed.path.rstrip("/"), "", "", ""))
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def clip_identity(url: str) -> str:
+    """
+    Return a stable identity string for deduplication.
+
+    Prefer: last path segment after '/clip/' if present.
+    Fallback: normalized URL.
+    """
+    norm = normalize_clip_url(url)
+    _, sep, tail = norm.rpartition("/clip/")
+    if sep:
+        segment = tail.partition("/")[0]
+        if segment:
+            # Interned: slugs are used as dict keys in filtering, so equal keys
+            # compare by pointer.
+            return sys.intern(segment)
+    return sys.intern(norm)
+
+
+@dataclass(slots=True, frozen=True)
 class ClipRef:
     """Pre-download clip reference from scraping."""
 
@@ -51,15 +110,26 @@ class ClipRef:
     views: Optional[int] = None
     title: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Interned: streamer names repeat across scrapes and are used as dict keys in
+        # filtering, so equal keys compare by pointer.
+        if self.streamer:
+            object.__setattr__(self, "streamer", sys.intern(self.streamer))
+
+    @property
+    def identity(self) -> str:
+        """Dedup key for clip_url (see clip_identity); memoized per URL."""
+        return clip_identity(self.clip_url)
+
     @classmethod
     def from_url(cls, url: str) -> "ClipRef":
         """Adapter: create ClipRef from URL string for backward compatibility."""
         return cls(clip_url=url, streamer="")
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipAsset:
-    """Post-download clip with paths and metadata."""
+    """Post-download clip with paths and metadata (mutable: duration_s is filled in later)."""
 
     clip_ref: ClipRef
     mp4_url: str
@@ -83,8 +153,12 @@ class ClipAsset:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "ClipAsset":
-        """Deserialize from dict (e.g. read from JSON). Ignores schema_version for now."""
+    def from_dict(cls, data: dict[str, Any], *, default_output_path: str = "") -> "ClipAsset":
+        """
+        Deserialize from dict (e.g. read from JSON). Ignores schema_version for now.
+
+        default_output_path is used when the dict has no output_path (older sidecars).
+        """
         ref = ClipRef(
             clip_url=data["clip_url"],
             streamer=data.get("streamer", ""),
@@ -94,13 +168,27 @@ class ClipAsset:
         return cls(
             clip_ref=ref,
             mp4_url=data["mp4_url"],
-            output_path=data.get("output_path", ""),
+            output_path=data.get("output_path", default_output_path),
             downloaded_at=data["downloaded_at"],
             duration_s=data.get("duration_s"),
             created_at=data.get("created_at"),
         )
 
 
+_SIDECAR_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file_bytes(path: Path, payload: bytes) -> None:
+    """Write payload with raw fd calls; sidecars are small, so buffering adds nothing."""
+    fd = os.open(path, _SIDECAR_OPEN_FLAGS, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def write_clip_metadata(asset: ClipAsset) -> Path:
     """
     Write clip metadata JSON sidecar next to the mp4.
@@ -114,8 +202,8 @@ def write_clip_metadata(asset: ClipAsset) -> Path:
     tmp_path = json_path.with_suffix(".json.tmp")
     data = asset.to_dict()
     data["output_path"] = asset.output_path
-    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    tmp_path.replace(json_path)
+    _write_file_bytes(tmp_path, json_codec.dumps(data, indent=True))
+    os.replace(tmp_path, json_path)
     return json_path
 
 
@@ -130,7 +218,8 @@ def read_clip_metadata(path: Path) -> ClipAsset:
         p = p.with_suffix(".json")
     if p.suffix.lower() != ".json":
         p = Path(str(p) + ".json")
-    data = json.loads(p.read_text(encoding="utf-8"))
-    if "output_path" not in data and p.suffix == ".json":
-        data["output_path"] = str(p.with_suffix(".mp4"))
-    return ClipAsset.from_dict(data)
+    default_output_path = str(p.with_suffix(".mp4")) if p.suffix == ".json" else ""
+    return ClipAsset.from_dict(
+        json_codec.loads(p.read_bytes()),
+        default_output_path=default_output_path,
+    )
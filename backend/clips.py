@@ -3,6 +3,8 @@ import json
 import logging
 import os
 import re
+import shutil
+import subprocess
 import time
 import threading
 import urllib.request
@@ -19,6 +21,7 @@ from backend.clip_models import (
     parse_views,
     write_clip_metadata,
 )
+from backend.media_probe import probe_duration_seconds
 from moviepy.video.compositing.CompositeVideoClip import (
     CompositeVideoClip,
     concatenate_videoclips,
@@ -35,15 +38,74 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; matched against unescaped clip page HTML.
+_MP4_SRC_PATTERN = re.compile(r"""<(?:video|source)[^>]+src=["']([^"']+\.mp4[^"']*)["']""")
+
+
+def _escape_filter_value(value: str) -> str:
+    """Escape text for an ffmpeg filter option value inside a filtergraph string."""
+    for ch in "\\':":
+        value = value.replace(ch, "\\" + ch)
+    for ch in "\\'[],;":
+        value = value.replace(ch, "\\" + ch)
+    return value
+
+
+def _overlay_ffmpeg_cmd(ffmpeg_path: str, source_path: str, output_path: str, text: str) -> list:
+    """Build the drawtext command matching the MoviePy overlay (3s label, 0.5s fades)."""
+    drawtext = ":".join(
+        [
+            f"drawtext=text={_escape_filter_value(text)}",
+            "expansion=none",
+            "fontsize=50",
+            "fontcolor=white",
+            "box=1",
+            "boxcolor=red",
+            "x=45",
+            "y=600",
+            "enable=lt(t\\,3)",
+            "alpha=min(1\\,min(t/0.5\\,(3-t)/0.5))",  # ffmpeg min() is binary
+        ]
+    )
+    return [
+        ffmpeg_path,
+        "-y",
+        "-i",
+        source_path,
+        "-vf",
+        drawtext,
+        "-c:a",
+        "copy",  # only video is re-encoded
+        output_path,
+    ]
+
+
+def _render_overlay_ffmpeg(source_path: str, output_path: str, text: str) -> bool:
+    """Render the overlay in one ffmpeg pass. Returns False if ffmpeg is missing or fails."""
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        return False
+    try:
+        subprocess.run(
+            _overlay_ffmpeg_cmd(ffmpeg_path, source_path, output_path, text),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as exc:
+        # e.g. ffmpeg builds without the drawtext filter (no freetype).
+        logger.warning(
+            "ffmpeg overlay failed, falling back to MoviePy",
+            extra={"source_path": source_path, "error": str(exc)},
+        )
+        return False
+    return True
 
-def overlay(view_count, name, current_videos_dir):
-    """Add a streamer name overlay to the first clip."""
-    sanitized_name = name.strip("\n")
-    source_path = os.path.join(current_videos_dir, f"{view_count}{sanitized_name}0.mp4")
-    output_path = os.path.join(current_videos_dir, f"{view_count}{sanitized_name}0.5.mp4")
+
+def _render_overlay_moviepy(source_path: str, output_path: str, text: str) -> None:
     text_clip = (
         TextClip(
-            text=sanitized_name,
+            text=text,
             font_size=50,
             color="white",
             bg_color="red",
@@ -60,6 +122,21 @@ def overlay(view_count, name, current_videos_dir):
     )
 
 
+def overlay(view_count, name, current_videos_dir):
+    """
+    Add a streamer name overlay to the first clip.
+
+    Uses ffmpeg's drawtext filter when ffmpeg is on PATH (native single pass, audio copied);
+    falls back to MoviePy compositing otherwise.
+    """
+    sanitized_name = name.strip("\n")
+    source_path = os.path.join(current_videos_dir, f"{view_count}{sanitized_name}0.mp4")
+    output_path = os.path.join(current_videos_dir, f"{view_count}{sanitized_name}0.5.mp4")
+    if _render_overlay_ffmpeg(source_path, output_path, sanitized_name):
+        return
+    _render_overlay_moviepy(source_path, output_path, sanitized_name)
+
+
 def getclips(
     name,
     current_videos_dir=None,
@@ -275,17 +352,20 @@ def extract_mp4_url_from_html(html_text):
     """Extract the first MP4 URL from a Twitch clip HTML response."""
     if not html_text:
         return None
-    unescaped = html.unescape(html_text)
-    pattern = re.compile(r"""<(?:video|source)[^>]+src=["']([^"']+\.mp4[^"']*)["']""")
-    match = pattern.search(unescaped)
+    match = _MP4_SRC_PATTERN.search(html.unescape(html_text))
     return match.group(1) if match else None
 
 
 def fill_duration(asset: ClipAsset) -> ClipAsset:
     """
     Read duration from mp4 file and set asset.duration_s.
+    Uses ffprobe (container metadata only) when available, else MoviePy.
     On error (file missing, unreadable, etc.), sets duration_s=None and returns asset unchanged otherwise.
     """
+    probed = probe_duration_seconds(asset.output_path)
+    if probed is not None:
+        asset.duration_s = probed
+        return asset
     try:
         clip = VideoFileClip(asset.output_path)
         try:
@@ -25,6 +25,7 @@ DEFAULT_CLIP_WAIT_SECONDS = 560
 DEFAULT_DOWNLOAD_WAIT_SECONDS = 30
 DEFAULT_URL_OPEN_TIMEOUT_SECONDS = 15
 DEFAULT_TWITCH_GQL_TIMEOUT_SECONDS = 20
+DEFAULT_FFPROBE_TIMEOUT_SECONDS = 10
 
 # API request model defaults
 API_DEFAULT_VOD_MIN_COUNT = 1
@@ -7,40 +7,15 @@ Uses ClipRef only; no ClipAsset, no file I/O.
 
 from __future__ import annotations
 
-from urllib.parse import urlparse, urlunparse
+import heapq
 
-from backend.clip_models import ClipRef
+# normalize_clip_url/clip_identity live with ClipRef (which uses them); re-exported here.
+from backend.clip_models import ClipRef, clip_identity, normalize_clip_url
 
 
-def normalize_clip_url(url: str) -> str:
-    """
-    Normalize a clip URL for comparison.
-
-    Removes query params (?...) and trailing slash.
-    """
-    if not url:
-        return url
-    parsed = urlparse(url)
-    # Remove query and fragment
-    normalized = urlunparse(
-        (parsed.scheme, parsed.netloc, parsed.path.rstrip("/"), "", "", "")
-    )
-    return normalized
-
-
-def clip_identity(url: str) -> str:
-    """
-    Return a stable identity string for deduplication.
-
-    Prefer: last path segment after '/clip/' if present.
-    Fallback: normalized URL.
-    """
-    norm = normalize_clip_url(url)
-    if "/clip/" in norm:
-        segment = norm.split("/clip/")[-1].split("/")[0]
-        if segment:
-            return segment
-    return norm
+def _cap_sort_key(ref: ClipRef) -> tuple[int, str]:
+    """Views desc (None->0), then clip_url asc."""
+    return (-(ref.views if ref.views is not None else 0), ref.clip_url)
 
 
 def filter_clips(
@@ -51,51 +26,39 @@ def filter_clips(
     """
     Filter and deduplicate clips by identity; optionally cap per streamer.
 
-    - Deduplicate by clip_identity(clip_url). When duplicates exist, keep the
-      clip with higher views (None treated as 0).
+    - Deduplicate by clip_identity(clip_url), exposed as ClipRef.identity. When
+      duplicates exist, keep the clip with higher views (None treated as 0).
     - Preserve stable order: position follows first occurrence of each identity.
     - If max_per_streamer is set: keep at most N clips per streamer, preferring
       higher views; tie-break by clip_url. Streamer order follows first occurrence.
-    - Does not mutate the input list.
+    - Does not mutate the input list. The result is a new list holding the same
+      ClipRef objects (ClipRef is frozen, so no copies are made).
     """
     if not clips:
         return []
 
-    # Dedupe by identity: first-seen order, keep best (max views) per identity
-    order: list[str] = []
+    # Dedupe by identity in one pass. Dict insertion order is first-seen order, and
+    # replacing a value keeps its slot, so the best ref lands at the first position.
     best: dict[str, ClipRef] = {}
-
     for ref in clips:
-        ident = clip_identity(ref.clip_url)
-        views_val = ref.views if ref.views is not None else 0
-        if ident not in best or views_val > (best[ident].views or 0):
+        ident = ref.identity
+        prev = best.get(ident)
+        if prev is None or (ref.views or 0) > (prev.views or 0):
             best[ident] = ref
-        if ident not in order:
-            order.append(ident)
 
-    deduped = [best[i] for i in order]
+    deduped = list(best.values())
 
     if max_per_streamer is None:
         return deduped
 
-    # Cap per streamer: preserve first-seen order of streamers; within each,
-    # keep top max_per_streamer by views (tie-break clip_url).
-    streamer_order: list[str] = []
+    # Cap per streamer: dict keys keep first-seen streamer order; within each, keep
+    # top max_per_streamer by views (tie-break clip_url). nsmallest avoids a full sort.
     by_streamer: dict[str, list[ClipRef]] = {}
     for ref in deduped:
-        s = ref.streamer if ref.streamer is not None else ""
-        if s not in streamer_order:
-            streamer_order.append(s)
-        by_streamer.setdefault(s, []).append(ref)
+        by_streamer.setdefault(ref.streamer if ref.streamer is not None else "", []).append(ref)
 
     result: list[ClipRef] = []
-    for s in streamer_order:
-        group = by_streamer[s]
-        # Sort by views desc (None->0), then clip_url asc; take first N
-        group_sorted = sorted(
-            group,
-            key=lambda r: (-(r.views if r.views is not None else 0), r.clip_url),
-        )
-        result.extend(group_sorted[:max_per_streamer])
+    for group in by_streamer.values():
+        result.extend(heapq.nsmallest(max_per_streamer, group, key=_cap_sort_key))
 
     return result
@@ -1,11 +1,15 @@
 """
 In-memory job queue: create, enqueue, dequeue, lookup.
 
-No threading, async, or worker loop. FIFO order with deduplicate on enqueue.
+No async or worker loop. FIFO order with deduplicate on enqueue;
+a set of queued ids mirrors the deque so enqueue/dequeue stay O(1).
+Storage and queue order are guarded by one lock because FastAPI runs sync
+endpoints in a threadpool.
 """
 
 from __future__ import annotations
 
+import threading
 from collections import deque
 from typing import Optional
 
@@ -18,12 +22,28 @@ class InMemoryJobQueue:
 
     Jobs are stored by id. Queue order is managed separately.
     Enqueue does not duplicate a job already in the queue.
+    list_jobs() copies from an immutable snapshot that is rebuilt only when a job is
+    added, so readers never iterate the live dict while another thread writes it.
     """
 
     def __init__(self) -> None:
         self._jobs: dict[str, Job] = {}
         self._queue: deque[str] = deque()
         self._queued_ids: set[str] = set()
+        self._lock = threading.Lock()
+        self._snapshot: tuple[Job, ...] | None = None
+
+    def _store(self, job: Job) -> None:
+        """Store job by id under the lock."""
+        with self._lock:
+            self._store_locked(job)
+
+    def _store_locked(self, job: Job) -> None:
+        """Store job by id; invalidates the list_jobs snapshot. Caller holds _lock."""
+        if self._jobs.get(job.id) is job:
+            return
+        self._jobs[job.id] = job
+        self._snapshot = None
 
     def create_job(self, job_type: str, params: dict | None = None) -> Job:
         """
@@ -34,7 +54,7 @@ class InMemoryJobQueue:
         """
         p = params if params is not None else {}
         job = Job(type=job_type, params=p)
-        self._jobs[job.id] = job
+        self._store(job)
         return job
 
     def enqueue(self, job: Job) -> None:
@@ -44,11 +64,12 @@ class InMemoryJobQueue:
         If job id is already in the queue, does nothing (no duplicate).
         Stores the job if not yet stored.
         """
-        self._jobs[job.id] = job
-        if job.id in self._queued_ids:
-            return
-        self._queued_ids.add(job.id)
-        self._queue.append(job.id)
+        with self._lock:
+            self._store_locked(job)
+            if job.id in self._queued_ids:
+                return
+            self._queued_ids.add(job.id)
+            self._queue.append(job.id)
 
     def dequeue(self) -> Job | None:
         """
@@ -57,11 +78,12 @@ class InMemoryJobQueue:
         Returns None if queue is empty.
         Does not mutate job status (worker handles RUNNING).
         """
-        if not self._queue:
-            return None
-        job_id = self._queue.popleft()
-        self._queued_ids.discard(job_id)
-        return self._jobs.get(job_id)
+        with self._lock:
+            if not self._queue:
+                return None
+            job_id = self._queue.popleft()
+            self._queued_ids.discard(job_id)
+            return self._jobs.get(job_id)
 
     def get(self, job_id: str) -> Job | None:
         """Return Job by id, or None if not found."""
@@ -71,7 +93,10 @@ class InMemoryJobQueue:
         """
         Return all jobs, optionally filtered by status.
         """
-        jobs = list(self._jobs.values())
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = tuple(self._jobs.values())
+            snapshot = self._snapshot
         if status is not None:
-            jobs = [j for j in jobs if j.status == status]
-        return jobs
+            return [j for j in snapshot if j.status == status]
+        return list(snapshot)
@@ -0,0 +1,35 @@
+"""
+JSON encode/decode helpers with an optional orjson fast path.
+
+orjson is used when it is installed; otherwise the stdlib json module produces
+equivalent output (UTF-8 bytes, no ASCII escaping, compact separators unless indented).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch this alone.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes; indent=True uses two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
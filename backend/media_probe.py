@@ -0,0 +1,60 @@
+"""
+Lightweight media inspection via ffprobe.
+
+Reads container metadata only, which is far cheaper than opening a clip with MoviePy
+(full decoder start-up) just to learn its duration. Every helper returns None instead
+of raising so callers can fall back to slower readers.
+"""
+
+from __future__ import annotations
+
+import math
+import shutil
+import subprocess
+from functools import lru_cache
+
+from backend.config import DEFAULT_FFPROBE_TIMEOUT_SECONDS
+
+
+@lru_cache(maxsize=1)
+def ffprobe_available() -> bool:
+    """Return True if ffprobe is on PATH (looked up once per process)."""
+    return shutil.which("ffprobe") is not None
+
+
+def probe_duration_seconds(
+    path: str,
+    *,
+    timeout: float = DEFAULT_FFPROBE_TIMEOUT_SECONDS,
+) -> float | None:
+    """
+    Return the container duration of a media file in seconds.
+
+    Returns None if ffprobe is missing, fails, times out, or reports no positive duration.
+    """
+    if not ffprobe_available():
+        return None
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        path,
+    ]
+    try:
+        result = subprocess.run(
+            cmd,
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        duration = float(result.stdout.strip())
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+    if not math.isfinite(duration) or duration <= 0:
+        return None
+    return duration
@@ -2,22 +2,45 @@ import os
 import logging
 from pathlib import Path
 
-from moviepy.video.compositing.CompositeVideoClip import (
-    CompositeVideoClip,
-    concatenate_videoclips,
-)
-from moviepy.video.fx.SlideIn import SlideIn
-from moviepy.video.io.VideoFileClip import VideoFileClip
 from natsort import natsorted
 
 from backend.clip_models import read_clip_metadata
 
 logger = logging.getLogger(__name__)
 
+# MoviePy is imported on first compile() (its import pulls in numpy/imageio and probes
+# ffmpeg). Placeholders stay module attributes so tests can monkeypatch them.
+VideoFileClip = None
+CompositeVideoClip = None
+concatenate_videoclips = None
+SlideIn = None
+
+
+def _load_moviepy() -> None:
+    """Bind MoviePy names on first use; names already set (e.g. patched) are kept."""
+    global VideoFileClip, CompositeVideoClip, concatenate_videoclips, SlideIn
+    if VideoFileClip is None:
+        from moviepy.video.io.VideoFileClip import VideoFileClip
+    if CompositeVideoClip is None:
+        from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
+    if concatenate_videoclips is None:
+        from moviepy.video.compositing.CompositeVideoClip import concatenate_videoclips
+    if SlideIn is None:
+        from moviepy.video.fx.SlideIn import SlideIn
+
+
+_DIGITS = "0123456789"
+
 
 def _extract_streamer_name(filename):
-    """Remove digits and extension to recover streamer name from clip filename."""
-    return "".join(ch for ch in filename.strip(".mp4") if not ch.isdigit())
+    """
+    Recover streamer name from a legacy clip filename.
+
+    Files are named "{views}{streamer}0.mp4" (overlay output: "...0.5.mp4"), so strip the
+    extension, leading view digits and the trailing index; digits inside the name are kept.
+    """
+    stem = filename.removesuffix(".mp4")
+    return stem.lstrip(_DIGITS).rstrip(_DIGITS + ".") or stem
 
 
 def _resolve_streamer_metadata(file_path: str, filename: str) -> tuple[str, str]:
@@ -50,6 +73,7 @@ def compile(
     target_resolution=(1080, 1920),
 ):
     """Compile clips from currentVideos into a single highlight video."""
+    _load_moviepy()
     base_dir = os.path.dirname(__file__)
     repo_root = os.path.abspath(os.path.join(base_dir, os.pardir))
     current_videos_dir = current_videos_dir or os.path.join(repo_root, "currentVideos")
@@ -68,48 +92,52 @@ def compile(
     # These metadata files default to the backend folder unless overridden.
     time_stamps_path = time_stamps_path or os.path.join(base_dir, "time stamps")
     streamer_links_path = streamer_links_path or os.path.join(base_dir, "streamer links")
-    streamers = []
-    with open(time_stamps_path, "w") as time_stamps_file, open(
-        streamer_links_path, "w"
-    ) as streamer_links_file:
-        for root, _, files in os.walk(current_videos_dir):
-            files = natsorted(files)
-            files.reverse()
-            for file in files:
-                if os.path.splitext(file)[1] == ".mp4":
-                    file_path = os.path.join(root, file)
-                    try:
-                        video = VideoFileClip(file_path, target_resolution=target_resolution)
-                    except Exception as exc:
-                        logger.warning(
-                            "Skipping unreadable clip during compile",
-                            extra={"file_path": file_path, "error": str(exc)},
-                        )
-                        report["skipped_clips"].append(
-                            {
-                                "file_path": file_path,
-                                "reason": str(exc),
-                            }
-                        )
-                        continue
-                    loaded_videos.append(video)
-                    L.append(
-                        video.with_start(current_video_length - files.index(file)).with_effects(
-                            [SlideIn(1, "bottom")]
-                        )
+    # Metadata lines are collected and written once after the walk (files are created
+    # even when no clip is usable). Dict keeps first-seen streamer order.
+    time_stamp_lines: list[str] = []
+    streamer_links: dict[str, str] = {}
+    for root, _, files in os.walk(current_videos_dir):
+        files = natsorted(files)
+        files.reverse()
+        # Index into the full sorted listing feeds the legacy with_start offset.
+        for file_index, file in enumerate(files):
+            if os.path.splitext(file)[1] == ".mp4":
+                file_path = os.path.join(root, file)
+                try:
+                    video = VideoFileClip(file_path, target_resolution=target_resolution)
+                except Exception as exc:
+                    logger.warning(
+                        "Skipping unreadable clip during compile",
+                        extra={"file_path": file_path, "error": str(exc)},
+                    )
+                    report["skipped_clips"].append(
+                        {
+                            "file_path": file_path,
+                            "reason": str(exc),
+                        }
+                    )
+                    continue
+                loaded_videos.append(video)
+                L.append(
+                    video.with_start(current_video_length - file_index).with_effects(
+                        [SlideIn(1, "bottom")]
                     )
-                    # time stamp handler
-                    current_video_length = int(current_video_length)
-                    timestamp = f"{current_video_length // 60}:{current_video_length % 60:02d}"
-                    streamer_name, streamer_link = _resolve_streamer_metadata(file_path, file)
-                    time_stamps_file.write(f"{timestamp} - {streamer_name}\n")
-                    current_video_length += video.duration - 2
-                    # streamer link handler
-                    if streamer_name not in streamers:
-                        streamer_links_file.write(f"{streamer_name}: {streamer_link}\n")
-                        streamers.append(streamer_name)
-                    if current_video_length >= max_length_seconds:
-                        break
+                )
+                # time stamp handler
+                current_video_length = int(current_video_length)
+                timestamp = f"{current_video_length // 60}:{current_video_length % 60:02d}"
+                streamer_name, streamer_link = _resolve_streamer_metadata(file_path, file)
+                time_stamp_lines.append(f"{timestamp} - {streamer_name}\n")
+                current_video_length += video.duration - 2
+                # streamer link handler
+                if streamer_name not in streamer_links:
+                    streamer_links[streamer_name] = f"{streamer_name}: {streamer_link}\n"
+                if current_video_length >= max_length_seconds:
+                    break
+    with open(time_stamps_path, "w") as time_stamps_file:
+        time_stamps_file.write("".join(time_stamp_lines))
+    with open(streamer_links_path, "w") as streamer_links_file:
+        streamer_links_file.write("".join(streamer_links.values()))
     if not L:
         logger.error(
             "Compile aborted: no valid clips found",
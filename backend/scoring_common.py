@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable, Iterable, TypeVar
 
 T = TypeVar("T")
@@ -39,19 +40,37 @@ def compute_keyword_bonus(
         return 0.0
 
     haystack = text.lower() if config.case_insensitive else text
+    needles = _keyword_needles(
+        tuple(config.keywords),
+        case_insensitive=config.case_insensitive,
+        skip_empty=skip_empty_keywords,
+    )
     bonus = 0.0
+    # With a non-negative per-keyword bonus the running total only grows, so once it
+    # reaches the cap the remaining substring scans cannot change the result.
+    saturates = config.keyword_bonus >= 0
 
-    for keyword in config.keywords:
-        candidate = keyword
-        if skip_empty_keywords and not candidate:
-            continue
-        needle = candidate.lower() if config.case_insensitive else candidate
+    for needle in needles:
         if needle in haystack:
             bonus += config.keyword_bonus
+            if saturates and bonus >= config.keyword_cap:
+                break
 
     return min(bonus, config.keyword_cap)
 
 
+@lru_cache(maxsize=256)
+def _keyword_needles(
+    keywords: tuple[str, ...], *, case_insensitive: bool, skip_empty: bool
+) -> tuple[str, ...]:
+    """Normalized keywords; memoized since one keyword list scores every clip/segment."""
+    return tuple(
+        keyword.lower() if case_insensitive else keyword
+        for keyword in keywords
+        if keyword or not skip_empty
+    )
+
+
 def rank_by_keys(items: Iterable[T], key_fn: Callable[[T], tuple[Any, ...]]) -> list[T]:
     """Return a deterministic sorted list from key tuples."""
     return sorted(items, key=key_fn)
@@ -6,6 +6,9 @@ from __future__ import annotations
 
 from backend.vod_models import Segment
 
+# Cap for merged windows so one long burst of chat cannot swallow the timeline.
+_MAX_MERGED_DURATION_S = 120.0
+
 
 def spikes_to_segments(
     spikes: list[tuple[int, int]],
@@ -50,7 +53,6 @@ def merge_overlapping_segments(segments: list[Segment]) -> list[Segment]:
     if not segments:
         return []
 
-    max_merged_duration_s = 120.0
     ordered = sorted(segments, key=lambda segment: segment.start_s)
     merged: list[Segment] = [
         Segment(
@@ -65,7 +67,7 @@ def merge_overlapping_segments(segments: list[Segment]) -> list[Segment]:
         current = merged[-1]
         if next_segment.start_s <= current.end_s:
             merged_end = max(current.end_s, next_segment.end_s)
-            if merged_end - current.start_s > max_merged_duration_s:
+            if merged_end - current.start_s > _MAX_MERGED_DURATION_S:
                 merged.append(
                     Segment(
                         start_s=next_segment.start_s,
@@ -93,3 +95,49 @@ def merge_overlapping_segments(segments: list[Segment]) -> list[Segment]:
         )
 
     return merged
+
+
+def spikes_to_merged_segments(
+    spikes: list[tuple[int, int]],
+    *,
+    bucket_seconds: int,
+    padding_seconds: int,
+) -> list[Segment]:
+    """
+    Equivalent to merge_overlapping_segments(spikes_to_segments(...)) in one pass.
+
+    Padded windows are kept as plain tuples and merged in a single sweep, so Segment objects
+    (and their validation) are only built for the merged output.
+    """
+    if bucket_seconds <= 0:
+        raise ValueError("bucket_seconds must be > 0")
+    if padding_seconds < 0:
+        raise ValueError("padding_seconds must be >= 0")
+    if not spikes:
+        return []
+
+    half_bucket_s = bucket_seconds / 2.0
+    windows: list[tuple[float, float, float]] = []
+    for bucket_start_s, count in spikes:
+        spike_center_s = bucket_start_s + half_bucket_s
+        start_s = max(0.0, spike_center_s - padding_seconds)
+        end_s = spike_center_s + padding_seconds
+        if end_s <= start_s:
+            end_s = start_s + 1e-9
+        windows.append((start_s, end_s, float(count)))
+    # Stable sort on start only, matching the sort in spikes_to_segments.
+    windows.sort(key=lambda window: window[0])
+
+    merged: list[Segment] = []
+    current_start, current_end, current_score = windows[0]
+    for start_s, end_s, score in windows[1:]:
+        if start_s <= current_end:
+            merged_end = max(current_end, end_s)
+            if merged_end - current_start <= _MAX_MERGED_DURATION_S:
+                current_end = merged_end
+                current_score = max(current_score, score)
+                continue
+        merged.append(Segment(start_s=current_start, end_s=current_end, spike_score=current_score))
+        current_start, current_end, current_score = start_s, end_s, score
+    merged.append(Segment(start_s=current_start, end_s=current_end, spike_score=current_score))
+    return merged
@@ -6,6 +6,8 @@ Selects ranked clips until total duration falls within [min_seconds, max_seconds
 
 from __future__ import annotations
 
+from bisect import bisect_left
+
 from backend.clip_models import ClipAsset
 from backend.vod_models import Segment
 
@@ -43,9 +45,15 @@ def select_clips_for_duration(
     return result
 
 
-def _segments_overlap(first: Segment, second: Segment) -> bool:
-    """Return True when two segment windows overlap in VOD time."""
-    return not (first.end_s <= second.start_s or second.end_s <= first.start_s)
+def _overlaps_selected(starts: list[float], ends: list[float], segment: Segment) -> bool:
+    """
+    Return True when segment overlaps any selected window.
+
+    Selected windows are disjoint and kept sorted by start (so ends are sorted too); only the
+    window with the greatest start before segment.end_s can reach past segment.start_s.
+    """
+    i = bisect_left(starts, segment.end_s)
+    return i > 0 and ends[i - 1] > segment.start_s
 
 
 def select_non_overlapping_segments_for_duration(
@@ -83,22 +91,22 @@ def select_non_overlapping_segments_for_duration(
     timeline_end = max(segment.end_s for segment in valid_ranked)
     window_width = max(1.0, timeline_end / float(diversity_windows))
 
-    def _window_idx(segment: Segment) -> int:
-        return int(segment.start_s // window_width)
+    # Window ids are fixed per segment, so compute them once rather than on every pass.
+    window_ids = [int(segment.start_s // window_width) for segment in valid_ranked]
 
     selected: list[Segment] = []
+    # Timeline-sorted view of selected windows for O(log k) overlap checks.
+    selected_starts: list[float] = []
+    selected_ends: list[float] = []
     total = 0.0
     covered_windows: set[int] = set()
-    selected_ids: set[int] = set()
 
     for require_new_window in (True, False):
-        for segment in valid_ranked:
-            segment_id = id(segment)
-            if segment_id in selected_ids:
-                continue
-            if require_new_window and _window_idx(segment) in covered_windows:
+        for segment, window_id in zip(valid_ranked, window_ids):
+            if require_new_window and window_id in covered_windows:
                 continue
-            if any(_segments_overlap(segment, existing) for existing in selected):
+            # Also rejects segments picked in the first pass: a window always overlaps itself.
+            if _overlaps_selected(selected_starts, selected_ends, segment):
                 continue
 
             duration = segment.end_s - segment.start_s
@@ -106,8 +114,10 @@ def select_non_overlapping_segments_for_duration(
                 continue
 
             selected.append(segment)
-            selected_ids.add(segment_id)
-            covered_windows.add(_window_idx(segment))
+            pos = bisect_left(selected_starts, segment.start_s)
+            selected_starts.insert(pos, segment.start_s)
+            selected_ends.insert(pos, segment.end_s)
+            covered_windows.add(window_id)
             total += duration
             if total >= min_seconds:
                 return selected
@@ -12,16 +12,28 @@ import json
 import os
 import re
 import time
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 from urllib.parse import urlparse
 
-import requests
+from backend import json_codec
+
+if TYPE_CHECKING:
+    import requests
 
 GQL_ENDPOINT = "https://gql.twitch.tv/gql"
 # Public web client identifier used by the Twitch website client, not a developer app key.
 WEB_CLIENT_ID = "kimne78kx3ncx6brgo4mv6wki5h1ko"
 REQUIRED_JSONL_KEYS = ("vod_id", "offset_s", "created_at", "user_name", "message")
+_JSONL_WRITE_BUFFER_BYTES = 1 << 20
+_GQL_HEADERS = {
+    "Client-Id": WEB_CLIENT_ID,
+    "Content-Type": "application/json",
+}
+# Compiled once; resolve_vod_id keeps urlparse so host checks (www., m., any case) stay lenient.
+_URL_PATH_VOD_ID_RE = re.compile(r"/videos/(\d+)")
+_BARE_VOD_ID_RE = re.compile(r"(?:^|/)videos/(\d+)(?:$|[/?#])")
 
 
 class TwitchWebChatError(RuntimeError):
@@ -41,45 +53,19 @@ def resolve_vod_id(vod_url_or_id: str) -> str:
         host = parsed.netloc.lower()
         if "twitch.tv" not in host:
             raise ValueError("vod_url_or_id must be a Twitch VOD URL or numeric VOD id")
-        match = re.search(r"/videos/(\d+)", parsed.path)
+        match = _URL_PATH_VOD_ID_RE.search(parsed.path)
         if match:
             return match.group(1)
         raise ValueError("could not parse VOD id from Twitch URL path")
 
-    match = re.search(r"(?:^|/)videos/(\d+)(?:$|[/?#])", candidate)
+    match = _BARE_VOD_ID_RE.search(candidate)
     if match:
         return match.group(1)
     raise ValueError("vod_url_or_id must be a Twitch VOD URL or numeric VOD id")
 
 
-def build_gql_payload(
-    vod_id: str,
-    *,
-    cursor: str | None = None,
-    content_offset_seconds: float | None = None,
-    page_size: int = 50,
-) -> dict[str, Any]:
-    """
-    Build the Twitch web GraphQL payload for VOD comments.
-
-    If Twitch changes the expected payload schema, update this function.
-    """
-    if page_size < 1 or page_size > 100:
-        raise ValueError("page_size must be between 1 and 100")
-    if cursor is None and content_offset_seconds is None:
-        raise ValueError("content_offset_seconds is required when cursor is not provided")
-
-    offset_int = None
-    if content_offset_seconds is not None:
-        offset_int = max(0, int(content_offset_seconds))
-
-    variables: dict[str, Any] = {
-        "videoID": str(vod_id),
-        "first": int(page_size),
-        "cursor": cursor,
-        "contentOffsetSeconds": offset_int,
-    }
-    query = """
+# Static GraphQL document, built once at import; only "variables" change per page.
+_COMMENTS_QUERY = """
 query VideoCommentsByOffsetOrCursor(
   $videoID: ID!,
   $cursor: Cursor,
@@ -122,9 +108,38 @@ query VideoCommentsByOffsetOrCursor(
   }
 }
 """.strip()
+
+
+def build_gql_payload(
+    vod_id: str,
+    *,
+    cursor: str | None = None,
+    content_offset_seconds: float | None = None,
+    page_size: int = 50,
+) -> dict[str, Any]:
+    """
+    Build the Twitch web GraphQL payload for VOD comments.
+
+    If Twitch changes the expected payload schema, update this function and _COMMENTS_QUERY.
+    """
+    if page_size < 1 or page_size > 100:
+        raise ValueError("page_size must be between 1 and 100")
+    if cursor is None and content_offset_seconds is None:
+        raise ValueError("content_offset_seconds is required when cursor is not provided")
+
+    offset_int = None
+    if content_offset_seconds is not None:
+        offset_int = max(0, int(content_offset_seconds))
+
+    variables: dict[str, Any] = {
+        "videoID": str(vod_id),
+        "first": int(page_size),
+        "cursor": cursor,
+        "contentOffsetSeconds": offset_int,
+    }
     return {
         "operationName": "VideoCommentsByOffsetOrCursor",
-        "query": query,
+        "query": _COMMENTS_QUERY,
         "variables": variables,
     }
 
@@ -273,16 +288,14 @@ def _post_gql_with_retries(
     payload: dict[str, Any],
     retries_5xx: int = 2,
 ) -> dict[str, Any]:
-    headers = {
-        "Client-Id": WEB_CLIENT_ID,
-        "Content-Type": "application/json",
-    }
+    import requests
+
     last_exception: Exception | None = None
     for attempt in range(retries_5xx + 1):
         try:
             response = session.post(
                 GQL_ENDPOINT,
-                headers=headers,
+                headers=_GQL_HEADERS,
                 json=payload,
                 timeout=20,
             )
@@ -360,94 +373,101 @@ def fetch_vod_chat_messages_web(
     ):
         raise ValueError("end_offset_s must be >= start_offset_s")
 
+    # requests (urllib3, ssl, ...) is only imported once a fetch actually starts, so
+    # resolve_vod_id/write_chat_jsonl callers and CLI --help skip that import cost.
+    import requests
+
     start_value = float(start_offset_s) if start_offset_s is not None else 0.0
-    active_session = session or requests.Session()
-    cursor: str | None = None
-    current_offset = start_value
-    use_cursor = True
-
-    pages_fetched = 0
-    while True:
-        if max_pages is not None and pages_fetched >= max_pages:
-            break
-        payload = build_gql_payload(
-            vod_id,
-            cursor=cursor if use_cursor and cursor is not None else None,
-            content_offset_seconds=(
-                current_offset if (not use_cursor or cursor is None) else None
-            ),
-            page_size=page_size,
-        )
-        gql_payload: dict[str, Any] | None = None
-        page_error: TwitchWebChatError | None = None
-        for page_attempt in range(4):
-            candidate = _post_gql_with_retries(session=active_session, payload=payload)
-            if "errors" not in candidate:
-                gql_payload = candidate
+    # One session (and its pooled keep-alive connection) serves every page; a session
+    # created here is closed when the generator finishes or is closed early.
+    session_scope = nullcontext(session) if session is not None else requests.Session()
+    with session_scope as active_session:
+        cursor: str | None = None
+        current_offset = start_value
+        use_cursor = True
+
+        pages_fetched = 0
+        while True:
+            if max_pages is not None and pages_fetched >= max_pages:
                 break
-            if use_cursor and cursor is not None and _has_integrity_error(candidate):
+            payload = build_gql_payload(
+                vod_id,
+                cursor=cursor if use_cursor and cursor is not None else None,
+                content_offset_seconds=(
+                    current_offset if (not use_cursor or cursor is None) else None
+                ),
+                page_size=page_size,
+            )
+            gql_payload: dict[str, Any] | None = None
+            page_error: TwitchWebChatError | None = None
+            for page_attempt in range(4):
+                candidate = _post_gql_with_retries(session=active_session, payload=payload)
+                if "errors" not in candidate:
+                    gql_payload = candidate
+                    break
+                if use_cursor and cursor is not None and _has_integrity_error(candidate):
+                    gql_payload = candidate
+                    break
+                if _has_transient_graphql_error(candidate) and page_attempt < 3:
+                    time.sleep(0.25 * (page_attempt + 1))
+                    continue
+                page_error = TwitchWebChatError(
+                    "Twitch web chat endpoint returned GraphQL errors. "
+                    "If payload format changed, update build_gql_payload()."
+                )
                 gql_payload = candidate
                 break
-            if _has_transient_graphql_error(candidate) and page_attempt < 3:
-                time.sleep(0.25 * (page_attempt + 1))
-                continue
-            page_error = TwitchWebChatError(
-                "Twitch web chat endpoint returned GraphQL errors. "
-                "If payload format changed, update build_gql_payload()."
-            )
-            gql_payload = candidate
-            break
 
-        if gql_payload is None:
-            if page_error is not None:
-                raise page_error
-            raise TwitchWebChatError("Unexpected empty GraphQL payload during page retry loop.")
+            if gql_payload is None:
+                if page_error is not None:
+                    raise page_error
+                raise TwitchWebChatError("Unexpected empty GraphQL payload during page retry loop.")
 
-        if "errors" in gql_payload:
-            if use_cursor and cursor is not None and _has_integrity_error(gql_payload):
-                use_cursor = False
-                continue
-            _raise_graphql_error(gql_payload)
-
-        edges, has_next_page = _extract_edges(gql_payload)
-        if not edges:
-            break
-
-        last_cursor: str | None = None
-        should_stop = False
-        page_max_offset = current_offset
-        for edge in edges:
-            edge_cursor = edge.get("cursor")
-            if isinstance(edge_cursor, str):
-                last_cursor = edge_cursor
-            node = edge.get("node")
-            if not isinstance(node, dict):
-                continue
-            normalized = _normalize_comment(vod_id, node)
-            offset_s = float(normalized["offset_s"])
-            page_max_offset = max(page_max_offset, offset_s)
-            if start_offset_s is not None and offset_s < float(start_offset_s):
-                continue
-            if end_offset_s is not None and offset_s > float(end_offset_s):
-                should_stop = True
+            if "errors" in gql_payload:
+                if use_cursor and cursor is not None and _has_integrity_error(gql_payload):
+                    use_cursor = False
+                    continue
+                _raise_graphql_error(gql_payload)
+
+            edges, has_next_page = _extract_edges(gql_payload)
+            if not edges:
                 break
-            yield normalized
 
-        if should_stop:
-            break
-        if not has_next_page:
-            break
+            last_cursor: str | None = None
+            should_stop = False
+            page_max_offset = current_offset
+            for edge in edges:
+                edge_cursor = edge.get("cursor")
+                if isinstance(edge_cursor, str):
+                    last_cursor = edge_cursor
+                node = edge.get("node")
+                if not isinstance(node, dict):
+                    continue
+                normalized = _normalize_comment(vod_id, node)
+                offset_s = float(normalized["offset_s"])
+                page_max_offset = max(page_max_offset, offset_s)
+                if start_offset_s is not None and offset_s < float(start_offset_s):
+                    continue
+                if end_offset_s is not None and offset_s > float(end_offset_s):
+                    should_stop = True
+                    break
+                yield normalized
+
+            if should_stop:
+                break
+            if not has_next_page:
+                break
 
-        next_offset = max(current_offset + 1.0, float(int(page_max_offset) + 1))
-        if use_cursor and last_cursor:
-            cursor = last_cursor
+            next_offset = max(current_offset + 1.0, float(int(page_max_offset) + 1))
+            if use_cursor and last_cursor:
+                cursor = last_cursor
+                current_offset = next_offset
+                pages_fetched += 1
+                continue
+
+            use_cursor = False
             current_offset = next_offset
             pages_fetched += 1
-            continue
-
-        use_cursor = False
-        current_offset = next_offset
-        pages_fetched += 1
 
 
 def write_chat_jsonl(messages: Iterable[dict[str, Any]], out_path: Path) -> dict[str, Any]:
@@ -458,7 +478,9 @@ def write_chat_jsonl(messages: Iterable[dict[str, Any]], out_path: Path) -> dict
     last_offset_s: float | None = None
     vod_id: str | None = None
 
-    with out_path.open("w", encoding="utf-8", newline="\n") as handle:
+    # Binary mode: json_codec.dumps already yields UTF-8 bytes (orjson when installed).
+    # A 1 MiB buffer batches many ~200-byte records per write syscall.
+    with out_path.open("wb", buffering=_JSONL_WRITE_BUFFER_BYTES) as handle:
         for message in messages:
             missing = [key for key in REQUIRED_JSONL_KEYS if key not in message]
             if missing:
@@ -468,7 +490,7 @@ def write_chat_jsonl(messages: Iterable[dict[str, Any]], out_path: Path) -> dict
                 first_offset_s = offset_s
             last_offset_s = offset_s
             vod_id = str(message["vod_id"])
-            handle.write(json.dumps(message, ensure_ascii=False) + "\n")
+            handle.write(json_codec.dumps(message) + b"\n")
             messages_written += 1
 
     return {
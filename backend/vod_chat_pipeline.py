@@ -4,9 +4,11 @@ Glue pipeline for converting chat messages into ranked highlight segments.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+
 from backend.chat_import import load_chat_messages
 from backend.chat_spikes import bucket_chat_messages, detect_spikes
-from backend.segment_generator import merge_overlapping_segments, spikes_to_segments
+from backend.segment_generator import spikes_to_merged_segments
 from backend.segment_scoring import rank_segments
 from backend.vod_models import ChatMessage, Segment
 
@@ -23,17 +25,24 @@ def build_segment_contexts(
     if context_window_s < 0:
         raise ValueError("context_window_s must be >= 0")
 
+    # Sort message indices by timestamp once, then bisect each window: O((N + S) log N)
+    # instead of scanning every message per segment. Chat logs are normally already in
+    # time order, in which case matched indices need no re-sort to keep input order.
+    timestamps = [message.timestamp_s for message in messages]
+    order = sorted(range(len(messages)), key=timestamps.__getitem__)
+    sorted_timestamps = [timestamps[i] for i in order]
+    input_is_sorted = all(a < b for a, b in zip(order, order[1:]))
+
     contexts: dict[int, str] = {}
     for idx, segment in enumerate(segments):
-        lower = segment.start_s - context_window_s
-        upper = segment.end_s + context_window_s
-        matched = [
-            message.message
-            for message in messages
-            if lower <= message.timestamp_s <= upper
-        ]
-        if matched:
-            contexts[idx] = " ".join(matched)
+        lo = bisect_left(sorted_timestamps, segment.start_s - context_window_s)
+        hi = bisect_right(sorted_timestamps, segment.end_s + context_window_s)
+        if lo >= hi:
+            continue
+        matched = order[lo:hi]
+        if not input_is_sorted:
+            matched.sort()
+        contexts[idx] = " ".join(messages[i].message for i in matched)
     return contexts
 
 
@@ -64,12 +73,11 @@ def chat_messages_to_ranked_segments(
 
     buckets = bucket_chat_messages(messages, bucket_seconds=bucket_seconds)
     spikes = detect_spikes(buckets, min_count=min_count)
-    segments = spikes_to_segments(
+    merged = spikes_to_merged_segments(
         spikes,
         bucket_seconds=bucket_seconds,
         padding_seconds=padding_seconds,
     )
-    merged = merge_overlapping_segments(segments)
     contexts = build_segment_contexts(
         messages,
         merged,
@@ -9,14 +9,20 @@ from __future__ import annotations
 import os
 import shutil
 import subprocess
-from pathlib import Path
+from functools import lru_cache
 
 from backend.vod_models import Segment
 
+# Segments cut per ffmpeg process. Each cut is its own input-seeked read of the VOD, so one
+# process replaces N spawns without demuxing the gaps between highlights; the cap bounds
+# how many demuxers a single process keeps open.
+_CUTS_PER_FFMPEG_RUN = 16
 
+
+@lru_cache(maxsize=1)
 def ffmpeg_available() -> bool:
     """
-    Check if ffmpeg is available on PATH.
+    Check if ffmpeg is available on PATH (looked up once per process, like ffprobe_available).
 
     Returns:
         True if ffmpeg executable is found, False otherwise.
@@ -24,6 +30,26 @@ def ffmpeg_available() -> bool:
     return shutil.which("ffmpeg") is not None
 
 
+def _build_batch_cut_command(vod_path: str, cuts: list[tuple[int, float, float, str]]) -> list[str]:
+    """
+    Build one ffmpeg command that stream-copies several (index, start_s, duration, path) cuts.
+
+    Each cut opens vod_path as its own input with -ss/-t before -i (fast keyframe seek), and
+    output k maps only input k's first video/audio stream, like ffmpeg's default selection.
+    """
+    cmd = ["ffmpeg", "-y"]  # Overwrite output files
+    for _, start_s, duration, _ in cuts:
+        cmd.extend(["-ss", str(start_s)])
+        cmd.extend(["-t", str(duration)])
+        cmd.extend(["-i", vod_path])
+    for input_index, (_, _, _, output_path) in enumerate(cuts):
+        cmd.extend(["-map", f"{input_index}:v:0?"])
+        cmd.extend(["-map", f"{input_index}:a:0?"])
+        cmd.extend(["-c", "copy"])  # Copy streams without re-encode
+        cmd.append(output_path)
+    return cmd
+
+
 def cut_segments(
     vod_path: str,
     segments: list[Segment],
@@ -49,23 +75,26 @@ def cut_segments(
         ValueError: If vod_path does not exist or is not .mp4.
         RuntimeError: If ffmpeg is not found on PATH.
     """
-    # Validate input
-    if not os.path.exists(vod_path):
-        raise ValueError(f"vod_path does not exist: {vod_path}")
+    # Validate input (one stat; OSError mirrors os.path.exists returning False)
+    try:
+        os.stat(vod_path)
+    except OSError:
+        raise ValueError(f"vod_path does not exist: {vod_path}") from None
     if not vod_path.endswith(".mp4"):
         raise ValueError(f"vod_path must end with .mp4: {vod_path}")
     if not ffmpeg_available():
         raise RuntimeError("ffmpeg not found on PATH")
 
     # Ensure output directory exists
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
 
     # Determine which segments to cut
     segments_to_cut = segments
     if max_segments is not None:
         segments_to_cut = segments[:max_segments]
 
-    output_paths: list[str] = []
+    # (segment index, start_s, duration, output path) for every segment that is kept.
+    planned: list[tuple[int, float, float, str]] = []
     for i, segment in enumerate(segments_to_cut):
         # Compute segment duration
         duration = segment.end_s - segment.start_s
@@ -75,34 +104,21 @@ def cut_segments(
         # Build deterministic output filename
         start_int = int(segment.start_s)
         end_int = int(segment.end_s)
-        output_filename = (
-            f"segment_{i:03d}_{start_int}_{end_int}.mp4"
-        )
+        output_filename = f"segment_{i:03d}_{start_int}_{end_int}.mp4"
         output_path = os.path.join(output_dir, output_filename)
+        planned.append((i, segment.start_s, duration, output_path))
 
-        # Use ffmpeg to cut segment with stream copy (no re-encode)
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output file
-            "-ss", str(segment.start_s),  # Start time
-            "-t", str(duration),  # Duration
-            "-i", vod_path,  # Input
-            "-c", "copy",  # Copy streams without re-encode
-            output_path,
-        ]
-
+    for batch_start in range(0, len(planned), _CUTS_PER_FFMPEG_RUN):
+        batch = planned[batch_start : batch_start + _CUTS_PER_FFMPEG_RUN]
         try:
             subprocess.run(
-                cmd,
+                _build_batch_cut_command(vod_path, batch),
                 check=True,
                 capture_output=True,
                 text=True,
             )
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(
-                f"ffmpeg failed to cut segment {i}: {e.stderr}"
-            ) from e
-
-        output_paths.append(output_path)
+            indices = ", ".join(str(i) for i, _, _, _ in batch)
+            raise RuntimeError(f"ffmpeg failed to cut segments {indices}: {e.stderr}") from e
 
-    return output_paths
+    return [output_path for _, _, _, output_path in planned]
@@ -1,8 +1,16 @@
-import json
 import os
+import shutil
 import subprocess
 from datetime import datetime, timezone
 
+from backend import json_codec
+
+_DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+# yt-dlp output template printing only the info-dict keys _write_metadata reads, as one JSON
+# object, instead of the full --dump-json dict (formats, thumbnails, chapters, ...).
+_YTDLP_METADATA_TEMPLATE = "%(.{title,uploader,duration,view_count,category,statistics})j"
+
 
 class VodAsset:
     """Represents downloaded VOD with metadata and paths."""
@@ -24,8 +32,13 @@ class VodAsset:
 
 def _download_local_file(local_path: str, output_mp4: str) -> None:
     """Copy a local mp4 file to the output directory."""
-    with open(local_path, 'rb') as fsrc, open(output_mp4, 'wb') as fdst:
-        fdst.write(fsrc.read())
+    # Re-ingesting output_dir/vod.mp4 itself: nothing to copy (opening it for write
+    # would truncate the source).
+    if os.path.exists(output_mp4) and os.path.samefile(local_path, output_mp4):
+        return
+    # copyfile uses in-kernel copies (sendfile/copy_file_range) instead of reading
+    # the whole VOD into memory.
+    shutil.copyfile(local_path, output_mp4)
 
 
 def _download_direct_url(vod_url: str, output_mp4: str) -> None:
@@ -38,47 +51,43 @@ def _download_direct_url(vod_url: str, output_mp4: str) -> None:
             "Install it to download from direct URLs."
         )
 
-    response = requests.get(vod_url)
-    if response.status_code != 200:
-        raise RuntimeError(f"Failed to download from {vod_url}: {response.status_code}")
+    # Stream to disk in 1 MiB chunks so a multi-GB VOD never sits in memory whole.
+    response = requests.get(vod_url, stream=True)
+    try:
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to download from {vod_url}: {response.status_code}")
 
-    with open(output_mp4, 'wb') as f:
-        f.write(response.content)
+        with open(output_mp4, "wb") as f:
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+                f.write(chunk)
+    finally:
+        response.close()
 
 
 def _download_twitch_vod(vod_url: str, output_mp4: str, quality: str = "480p") -> dict:
     """Download Twitch VOD using yt-dlp and extract metadata.
-    
-    Note: This makes two subprocess calls (metadata extraction + download).
-    Future optimization: could combine into single call with metadata output.
+
+    One yt-dlp process does both: --print emits the metadata subset to stdout and
+    --no-simulate still performs the download, so the manifest is fetched once.
     """
+    format_str = f"best[height<={quality.replace('p', '')}]"
     try:
-        # First, get metadata using --dump-json
         result = subprocess.run(
-            ['yt-dlp', '--dump-json', vod_url],
+            [
+                "yt-dlp",
+                "--print",
+                _YTDLP_METADATA_TEMPLATE,
+                "--no-simulate",
+                "-f",
+                format_str,
+                "-o",
+                output_mp4,
+                vod_url,
+            ],
             capture_output=True,
             text=True,
             check=True,
         )
-        metadata = json.loads(result.stdout)
-    except FileNotFoundError:
-        raise RuntimeError(
-            "yt-dlp is not installed. "
-            "Please install it to download Twitch VODs."
-        )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to get metadata from {vod_url}: {e}")
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse metadata from {vod_url}: {e}")
-
-    # Now download the video with quality filter
-    try:
-        format_str = f"best[height<={quality.replace('p', '')}]"
-        
-        subprocess.run(
-            ['yt-dlp', '-f', format_str, '-o', output_mp4, vod_url],
-            check=True,
-        )
     except FileNotFoundError:
         raise RuntimeError(
             "yt-dlp is not installed. "
@@ -87,7 +96,12 @@ def _download_twitch_vod(vod_url: str, output_mp4: str, quality: str = "480p") -
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Failed to download VOD from {vod_url}: {e}")
 
-    return metadata
+    # The metadata subset is printed as a single JSON line; take the last non-empty one.
+    lines = [line for line in (result.stdout or "").splitlines() if line.strip()]
+    try:
+        metadata = json_codec.loads(lines[-1] if lines else "")
+    except json_codec.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to parse metadata from {vod_url}: {e}")
 
     return metadata
 
@@ -126,8 +140,9 @@ def _write_metadata(
         ).get('views')
         metadata['views'] = views
 
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    # json_codec emits UTF-8 bytes (orjson when installed), same indented layout.
+    with open(metadata_path, "wb") as f:
+        f.write(json_codec.dumps(metadata, indent=True))
 
 
 def download_vod(vod_url: str, *, output_dir: str = ".", quality: str = "480p") -> VodAsset:
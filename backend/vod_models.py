@@ -32,9 +32,13 @@ class VodJobParams:
             raise ValueError("max_segments must be positive if provided")
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
-    """A parsed chat entry with timestamp from VOD start."""
+    """
+    A parsed chat entry with timestamp from VOD start.
+
+    Slotted: a VOD replay loads one instance per chat line, so no per-instance __dict__.
+    """
 
     timestamp_s: float
     message: str
@@ -46,7 +50,7 @@ class ChatMessage:
             raise ValueError("message must not be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """A highlight segment candidate and its scores."""
 
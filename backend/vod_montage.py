@@ -7,23 +7,32 @@ Compiles cut segment clips into a final montage MP4 with duration constraints.
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from backend.media_probe import probe_duration_seconds
+
 try:
     from moviepy.video.io.VideoFileClip import VideoFileClip
 except ImportError:
     VideoFileClip = None
 
+# Clips probed concurrently; each probe is an ffprobe subprocess, so threads are not GIL-bound.
+_MAX_PROBE_WORKERS = 8
 
-def _get_clip_duration(clip_path: str) -> float | None:
-    """
-    Get duration of an mp4 clip in seconds.
+# Memoized clip durations; bounded so a long-lived worker does not grow without limit.
+_DURATION_CACHE_SIZE = 512
+
+
+def _read_clip_duration(clip_path: str) -> float | None:
+    """Read duration via ffprobe (container metadata only) when available, else MoviePy."""
+    probed = probe_duration_seconds(clip_path)
+    if probed is not None:
+        return probed
 
-    Returns:
-        Duration in seconds, or None if unable to read.
-    """
     if VideoFileClip is None:
         return None
 
@@ -38,6 +47,28 @@ def _get_clip_duration(clip_path: str) -> float | None:
         return None
 
 
+@lru_cache(maxsize=_DURATION_CACHE_SIZE)
+def _cached_clip_duration(clip_path: str, mtime_ns: int, size: int) -> float | None:
+    """Keyed on (path, mtime, size) so a rewritten file is read again."""
+    return _read_clip_duration(clip_path)
+
+
+def _get_clip_duration(clip_path: str) -> float | None:
+    """
+    Get duration of an mp4 clip in seconds.
+
+    Reads are memoized per (path, mtime, size) in a bounded LRU cache.
+
+    Returns:
+        Duration in seconds, or None if unable to read.
+    """
+    try:
+        st = os.stat(clip_path)
+    except OSError:
+        return None
+    return _cached_clip_duration(clip_path, st.st_mtime_ns, st.st_size)
+
+
 def compile_vod_montage(
     segment_paths: list[str],
     *,
@@ -68,14 +99,19 @@ def compile_vod_montage(
         raise ValueError("segment_paths must not be empty")
 
     # Filter to existing files
-    existing_paths = [p for p in segment_paths if os.path.exists(p)]
+    existing_paths = [p for p in segment_paths if os.path.isfile(p)]
     if not existing_paths:
         raise ValueError("no valid segment files found in segment_paths")
 
-    # Get durations for each clip
-    durations: dict[str, float | None] = {}
-    for path in existing_paths:
-        durations[path] = _get_clip_duration(path)
+    # Get durations for each clip (in parallel unless there are too few to repay the pool)
+    if len(existing_paths) > 2:
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_PROBE_WORKERS, len(existing_paths))
+        ) as executor:
+            probed = list(executor.map(_get_clip_duration, existing_paths))
+    else:
+        probed = [_get_clip_duration(path) for path in existing_paths]
+    durations: dict[str, float | None] = dict(zip(existing_paths, probed))
 
     # Select clips within duration window (greedy, in order)
     selected_paths: list[str] = []
@@ -104,47 +140,48 @@ def compile_vod_montage(
             "no valid clips found (all have missing/zero duration)"
         )
 
-    # Write ffmpeg concat list to temp file
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".txt",
-        delete=False,
-        encoding="utf-8",
-    ) as f:
-        concat_file = f.name
-        for path in selected_paths:
-            # Convert backslashes to forward slashes for ffmpeg compatibility
-            normalized_path = path.replace("\\", "/")
-            f.write(f"file '{normalized_path}'\n")
-
+    # A one-clip montage is that clip: copy it (in-kernel) instead of spawning an ffmpeg remux.
+    if len(selected_paths) == 1:
+        # output_path may already be that clip; copyfile would raise SameFileError.
+        if not (os.path.exists(output_path) and os.path.samefile(selected_paths[0], output_path)):
+            shutil.copyfile(selected_paths[0], output_path)
+        return output_path
+
+    # Feed the concat list to ffmpeg on stdin. Entries are explicit file: URLs because the
+    # demuxer resolves bare names against the list's own URL (here "pipe:").
+    concat_lines = ["ffconcat version 1.0\n"]
+    for path in selected_paths:
+        # Convert backslashes to forward slashes for ffmpeg compatibility
+        normalized_path = os.path.abspath(path).replace("\\", "/")
+        escaped_path = normalized_path.replace("'", "'\\''")
+        concat_lines.append(f"file 'file:{escaped_path}'\n")
+
+    cmd = [
+        "ffmpeg",
+        "-y",  # Overwrite
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-protocol_whitelist",
+        "file,pipe",
+        "-i",
+        "pipe:0",
+        "-c",
+        "copy",  # Stream copy (no re-encode)
+        output_path,
+    ]
     try:
-        # Run ffmpeg concat
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite
-            "-f", "concat",
-            "-safe", "0",
-            "-i", concat_file,
-            "-c", "copy",  # Stream copy (no re-encode)
-            output_path,
-        ]
-
-        result = subprocess.run(
+        subprocess.run(
             cmd,
+            input="".join(concat_lines),
             check=True,
             capture_output=True,
             text=True,
         )
-
     except subprocess.CalledProcessError as e:
         raise RuntimeError(
             f"ffmpeg concat failed: {e.stderr}"
         ) from e
-    finally:
-        # Clean up temp concat file
-        try:
-            os.unlink(concat_file)
-        except OSError:
-            pass
 
     return output_path
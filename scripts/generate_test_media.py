@@ -5,6 +5,7 @@ Creates mp4 files under tests/media/ using ffmpeg only. Idempotent:
 only generates files that are missing. Run from repo root or any directory.
 """
 
+import functools
 import os
 import shutil
 import subprocess
@@ -46,6 +47,7 @@ VIDEOS = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def ffmpeg_ok() -> bool:
     return shutil.which("ffmpeg") is not None
 
@@ -68,10 +70,11 @@ def generate_one(
     duration: int,
     lavfi_input: list[str],
     drawtext_vf: str | None,
-) -> bool:
+) -> str | None:
+    """Generate one asset if missing; return its path, or None if ffmpeg failed."""
     out_path = os.path.join(MEDIA_DIR, out_basename)
     if os.path.isfile(out_path):
-        return True
+        return out_path
     os.makedirs(MEDIA_DIR, exist_ok=True)
     # -t to enforce duration; -b:v low to keep <1MB
     common = [
@@ -91,27 +94,24 @@ def generate_one(
         args = ["-f", "lavfi", "-i", lavfi_input[0], "-vf", drawtext_vf] + common
     else:
         args = ["-f", "lavfi", "-i", lavfi_input[0]] + common
-    return run_ffmpeg(args)
+    return out_path if run_ffmpeg(args) else None
 
 
 def main() -> int:
     if not ffmpeg_ok():
         print("ffmpeg not found. Install ffmpeg and ensure it is on PATH.", file=sys.stderr)
         return 1
-    generated = 0
+    results: dict[str, str] = {}
     for out_basename, duration, lavfi_input, drawtext_vf in VIDEOS:
-        if not generate_one(out_basename, duration, lavfi_input, drawtext_vf):
+        out_path = generate_one(out_basename, duration, lavfi_input, drawtext_vf)
+        if out_path is None:
             return 1
-        out_path = os.path.join(MEDIA_DIR, out_basename)
-        if os.path.isfile(out_path):
-            generated += 1
+        results[out_basename] = out_path
     # Print final file sizes
     print("Test media under tests/media/:")
-    for out_basename, _, _, _ in VIDEOS:
-        path = os.path.join(MEDIA_DIR, out_basename)
-        if os.path.isfile(path):
-            size = os.path.getsize(path)
-            print(f"  {out_basename}: {size:,} bytes")
+    for out_basename, path in results.items():
+        size = os.stat(path).st_size
+        print(f"  {out_basename}: {size:,} bytes")
     return 0
 
 
@@ -18,6 +18,7 @@ Failure modes:
 from __future__ import annotations
 
 import json
+import os
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -40,67 +41,45 @@ def _write_fake_vod(path: Path) -> None:
     path.write_bytes(b"not-a-real-video-but-sufficient-for-local-copy-test")
 
 
+_CHAT_BASE = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _iso(offset_s: float) -> str:
+    """Wall-clock created_at for a chat offset (whole seconds, like Twitch)."""
+    return (_CHAT_BASE + timedelta(seconds=int(offset_s))).isoformat()
+
+
+def _chat_record(offset_s: float, user_name: str, message: str) -> dict[str, object]:
+    return {
+        "vod_id": "999999",
+        "offset_s": offset_s,
+        "timestamp_s": offset_s,
+        "created_at": _iso(offset_s),
+        "user_name": user_name,
+        "message": message,
+    }
+
+
 def _write_fake_chat_jsonl(path: Path) -> None:
     """Generate deterministic chat with quiet + burst windows to force spike detection."""
-    base = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-    records: list[dict[str, object]] = []
-
-    # Quiet from 0-20s.
-    for second in range(0, 21, 2):
-        records.append(
-            {
-                "vod_id": "999999",
-                "offset_s": float(second),
-                "timestamp_s": float(second),
-                "created_at": (base + timedelta(seconds=second)).isoformat(),
-                "user_name": "quiet_user",
-                "message": "quiet",
-            }
-        )
-
-    # Burst around 30s.
-    for idx in range(45):
-        offset = 30.0 + (idx % 3) * 0.25
-        records.append(
-            {
-                "vod_id": "999999",
-                "offset_s": offset,
-                "timestamp_s": offset,
-                "created_at": (base + timedelta(seconds=int(offset))).isoformat(),
-                "user_name": f"burst_a_{idx}",
-                "message": "wow insane play",
-            }
-        )
-
-    # Quiet 40-60s.
-    for second in range(40, 61, 5):
-        records.append(
-            {
-                "vod_id": "999999",
-                "offset_s": float(second),
-                "timestamp_s": float(second),
-                "created_at": (base + timedelta(seconds=second)).isoformat(),
-                "user_name": "quiet_user",
-                "message": "calm",
-            }
-        )
-
-    # Burst around 70s.
-    for idx in range(45):
-        offset = 70.0 + (idx % 4) * 0.2
-        records.append(
-            {
-                "vod_id": "999999",
-                "offset_s": offset,
-                "timestamp_s": offset,
-                "created_at": (base + timedelta(seconds=int(offset))).isoformat(),
-                "user_name": f"burst_b_{idx}",
-                "message": "insane wow moment",
-            }
-        )
-
-    lines = [json.dumps(record) for record in records]
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    records = (
+        # Quiet from 0-20s.
+        [_chat_record(float(second), "quiet_user", "quiet") for second in range(0, 21, 2)]
+        # Burst around 30s.
+        + [
+            _chat_record(30.0 + (idx % 3) * 0.25, f"burst_a_{idx}", "wow insane play")
+            for idx in range(45)
+        ]
+        # Quiet 40-60s.
+        + [_chat_record(float(second), "quiet_user", "calm") for second in range(40, 61, 5)]
+        # Burst around 70s.
+        + [
+            _chat_record(70.0 + (idx % 4) * 0.2, f"burst_b_{idx}", "insane wow moment")
+            for idx in range(45)
+        ]
+    )
+
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
 
 
 def test_vod_highlights_job_e2e_offline(tmp_path, monkeypatch) -> None:
@@ -194,10 +173,8 @@ def test_vod_highlights_job_e2e_offline(tmp_path, monkeypatch) -> None:
     ):
         assert key in result
 
-    assert Path(result["vod_path"]).exists()
-    assert Path(result["chat_path"]).exists()
-    assert Path(result["montage_path"]).exists()
-    assert Path(result["clips_dir"]).exists()
+    for key in ("vod_path", "chat_path", "montage_path", "clips_dir"):
+        assert os.path.exists(result[key]), key
 
     assert result["segments_count"] > 0
     assert result["clips_count"] > 0
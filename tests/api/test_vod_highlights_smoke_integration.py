@@ -9,6 +9,7 @@ Test Plan
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
@@ -34,17 +35,25 @@ def _require_live_integration() -> None:
         pytest.skip("RUN_TWITCH_INTEGRATION=1 required for live VOD smoke test.")
 
 
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> str | None:
+    """Memoized shutil.which; PATH is scanned once per executable name."""
+    return shutil.which(name)
+
+
 def _require_runtime_dependencies() -> None:
     scripts_dir = Path(sys.executable).parent
     yt_dlp_name = "yt-dlp.exe" if os.name == "nt" else "yt-dlp"
     yt_dlp_from_venv = scripts_dir / yt_dlp_name
-    if yt_dlp_from_venv.exists() and shutil.which("yt-dlp") is None:
+    if yt_dlp_from_venv.exists() and _which("yt-dlp") is None:
         os.environ["PATH"] = f"{scripts_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+        # PATH changed; drop lookups cached against the old value.
+        _which.cache_clear()
 
     missing: list[str] = []
-    if shutil.which("yt-dlp") is None:
+    if _which("yt-dlp") is None:
         missing.append("yt-dlp")
-    if shutil.which("ffmpeg") is None:
+    if _which("ffmpeg") is None:
         missing.append("ffmpeg")
     if missing:
         pytest.skip(f"Missing required runtime dependency(s): {', '.join(missing)}")
@@ -227,12 +236,10 @@ def test_vod_highlights_smoke_full_pipeline_live(tmp_path: Path) -> None:
     clips_dir = Path(result["clips_dir"])
     metadata_path = Path(result["metadata_path"])
 
-    # Ensure key artifacts exist and are non-empty.
-    assert vod_path.exists() and vod_path.stat().st_size > 0
-    assert chat_path.exists() and chat_path.stat().st_size > 0
-    assert montage_path.exists() and montage_path.stat().st_size > 0
-    assert metadata_path.exists() and metadata_path.stat().st_size > 0
-    assert clips_dir.exists()
+    # Ensure key artifacts exist and are non-empty (os.stat raises if missing).
+    for artifact_path in (vod_path, chat_path, montage_path, metadata_path):
+        assert os.stat(artifact_path).st_size > 0, artifact_path
+    assert os.path.isdir(clips_dir)
 
     clip_files = list(clips_dir.glob("*.mp4"))
     assert len(clip_files) >= 1
@@ -0,0 +1,40 @@
+"""
+Shared assertions for ranking functions (rank_clips, rank_segments).
+
+Both rankers return a new list sorted by score descending and must not mutate input
+(neither the list nor the items' fields).
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def fingerprint(obj: Any) -> bytes:
+    """Byte snapshot of obj and every field it reaches; unequal after any in-place change."""
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def assert_ranked_desc(ranked: Sequence[T], score_fn: Callable[[T], float]) -> None:
+    """Scores of ranked items are non-increasing."""
+    scores = [score_fn(item) for item in ranked]
+    assert scores == sorted(scores, reverse=True)
+
+
+def assert_rank_does_not_mutate(rank_fn: Callable[[list[T]], list[T]], items: list[T]) -> None:
+    """rank_fn returns a new list holding the same items and leaves the input untouched."""
+    before = fingerprint(items)
+    snapshot_ids = [id(item) for item in items]
+    ranked = rank_fn(items)
+    assert ranked is not items
+    assert fingerprint(items) == before
+    assert [id(item) for item in items] == snapshot_ids
+    assert sorted(map(id, ranked)) == sorted(snapshot_ids)
+
+
+def assert_rank_empty(rank_fn: Callable[[list[T]], list[T]]) -> None:
+    """Empty input ranks to an empty list."""
+    assert rank_fn([]) == []
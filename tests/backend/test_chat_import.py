@@ -39,6 +39,17 @@ def test_load_chat_messages_jsonl_parses_messages(tmp_path: Path) -> None:
     assert [m.message for m in messages] == ["hello", "pog"]
 
 
+def test_load_chat_messages_jsonl_keeps_unicode_line_separator_in_message(
+    tmp_path: Path,
+) -> None:
+    """Only \\n/\\r end a JSONL record; a raw U+2028 inside a message stays in that message."""
+    path = tmp_path / "chat.jsonl"
+    record = json.dumps({"timestamp_s": 3, "message": "a\u2028b"}, ensure_ascii=False)
+    path.write_text(record + "\n", encoding="utf-8")
+    messages = load_chat_messages(str(path))
+    assert [m.message for m in messages] == ["a\u2028b"]
+
+
 def test_load_chat_messages_jsonl_invalid_json_raises(tmp_path: Path) -> None:
     """Malformed JSONL line returns a line-specific error."""
     path = tmp_path / "chat.jsonl"
@@ -5,6 +5,7 @@ Test Plan
 - Failure modes: invalid parse_views input
 """
 
+import dataclasses
 import json
 from pathlib import Path
 
@@ -43,6 +44,12 @@ def test_parse_views_invalid_returns_none() -> None:
     assert parse_views("1.2.3") is None
 
 
+def test_parse_views_none_and_repeated_inputs() -> None:
+    """Boundary: None short-circuits; repeated strings return the same cached value."""
+    assert parse_views(None) is None
+    assert parse_views("3.4K") == parse_views("3.4K") == 3400
+
+
 def test_clip_ref_creation_missing_title_views() -> None:
     """Boundary: ClipRef with missing optional title and views."""
     ref = ClipRef(clip_url="https://twitch.tv/x/clip/y", streamer="x")
@@ -129,3 +136,19 @@ def test_read_clip_metadata_without_schema_version(tmp_path: Path) -> None:
     )
     asset = read_clip_metadata(json_path)
     assert asset.clip_ref.clip_url == "https://old"
+
+
+def test_clip_ref_identity_is_a_property_not_a_field() -> None:
+    """ClipRef exposes its dedup identity without adding a dataclass field."""
+    ref = ClipRef(clip_url="https://twitch.tv/x/clip/Slug?t=5")
+    assert ref.identity == "Slug"
+    assert ref == ClipRef(clip_url="https://twitch.tv/x/clip/Slug?t=5")
+    assert [f.name for f in dataclasses.fields(ref)] == ["clip_url", "streamer", "views", "title"]
+
+
+def test_clip_ref_is_frozen_and_slotted() -> None:
+    """Defect: ClipRef fields cannot be reassigned (keeps identity consistent)."""
+    ref = ClipRef(clip_url="https://twitch.tv/x/clip/a", views=1)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ref.clip_url = "https://twitch.tv/x/clip/b"  # type: ignore[misc]
+    assert not hasattr(ref, "__dict__")
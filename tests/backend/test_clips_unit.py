@@ -5,6 +5,9 @@ Test Plan
 - Failure modes: download_clip raises ValueError when no mp4 source is found
 """
 
+import re
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -232,6 +235,7 @@ def test_overlay_writes_expected_output(monkeypatch, tmp_path):
         def write_videofile(self, output_path, **_kwargs):
             captured["output_path"] = output_path
 
+    monkeypatch.setattr(clips, "_render_overlay_ffmpeg", lambda *_args: False)
     monkeypatch.setattr(clips, "TextClip", _DummyTextClip)
     monkeypatch.setattr(clips, "VideoFileClip", _DummyVideoFileClip)
     monkeypatch.setattr(clips, "CompositeVideoClip", _DummyCompositeVideoClip)
@@ -243,6 +247,105 @@ def test_overlay_writes_expected_output(monkeypatch, tmp_path):
     assert captured["output_path"].endswith("123streamer0.5.mp4")
 
 
+def test_overlay_prefers_ffmpeg_drawtext(monkeypatch, tmp_path):
+    # Covers: TODO-TEST-CLIPS-GETCLIPS
+    captured = {}
+
+    def _fake_run(cmd, **_kwargs):
+        captured["cmd"] = cmd
+
+    def _no_moviepy(*_args, **_kwargs):
+        raise AssertionError("MoviePy fallback should not run when ffmpeg succeeds")
+
+    monkeypatch.setattr(clips.shutil, "which", lambda _name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(clips.subprocess, "run", _fake_run)
+    monkeypatch.setattr(clips, "VideoFileClip", _no_moviepy)
+
+    clips.overlay("123", "stream:er\n", str(tmp_path))
+
+    cmd = captured["cmd"]
+    assert cmd[0] == "/usr/bin/ffmpeg"
+    assert cmd[cmd.index("-i") + 1].endswith("123stream:er0.mp4")
+    assert cmd[-1].endswith("123stream:er0.5.mp4")
+    drawtext = cmd[cmd.index("-vf") + 1]
+    assert drawtext.startswith("drawtext=text=stream\\\\:er:")
+    assert cmd[cmd.index("-c:a") + 1] == "copy"
+
+
+def test_overlay_falls_back_to_moviepy_when_ffmpeg_fails(monkeypatch, tmp_path):
+    # Covers: TODO-TEST-CLIPS-GETCLIPS
+    captured = {}
+
+    def _failing_run(cmd, **_kwargs):
+        raise clips.subprocess.CalledProcessError(1, cmd, stderr="No such filter: 'drawtext'")
+
+    monkeypatch.setattr(clips.shutil, "which", lambda _name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(clips.subprocess, "run", _failing_run)
+    monkeypatch.setattr(
+        clips,
+        "_render_overlay_moviepy",
+        lambda source, output, text: captured.update(source=source, output=output, text=text),
+    )
+
+    clips.overlay("123", "streamer", str(tmp_path))
+
+    assert captured["source"].endswith("123streamer0.mp4")
+    assert captured["output"].endswith("123streamer0.5.mp4")
+    assert captured["text"] == "streamer"
+
+
+def _drawtext_expressions() -> dict[str, str]:
+    """The enable/alpha expressions of the overlay drawtext, with filtergraph escapes removed."""
+    cmd = clips._overlay_ffmpeg_cmd("ffmpeg", "in.mp4", "out.mp4", "streamer")
+    drawtext = cmd[cmd.index("-vf") + 1]
+    options = dict(opt.split("=", 1) for opt in drawtext.split(":")[1:])
+    return {key: options[key].replace("\\,", ",") for key in ("enable", "alpha")}
+
+
+def _call_arg_counts(expr: str) -> list[tuple[str, int]]:
+    """(function name, argument count) for every call in an ffmpeg expression."""
+    calls = []
+    stack: list[list] = []
+    for i, ch in enumerate(expr):
+        if ch == "(":
+            name = re.search(r"[a-z_]*$", expr[:i]).group()
+            stack.append([name, 0 if expr[i + 1] == ")" else 1])
+        elif ch == "," and stack:
+            stack[-1][1] += 1
+        elif ch == ")":
+            name, count = stack.pop()
+            if name:
+                calls.append((name, count))
+    return calls
+
+
+def test_overlay_drawtext_expressions_use_binary_min_and_lt():
+    # Covers: TODO-TEST-CLIPS-GETCLIPS
+    # ffmpeg's min()/lt() take exactly two arguments; a third fails filter graph setup.
+    for expr in _drawtext_expressions().values():
+        for name, count in _call_arg_counts(expr):
+            assert count == 2, f"{name}() called with {count} args in {expr!r}"
+
+
+@pytest.mark.integration
+def test_overlay_drawtext_expressions_parse_in_real_ffmpeg():
+    # Covers: TODO-TEST-CLIPS-GETCLIPS
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        pytest.skip("ffmpeg not available")
+
+    # aevalsrc evaluates with the same expression parser as drawtext, without needing freetype.
+    for expr in _drawtext_expressions().values():
+        escaped = expr.replace(",", "\\,")
+        result = subprocess.run(
+            [ffmpeg_path, "-v", "error", "-f", "lavfi", "-i", f"aevalsrc={escaped}:d=0.1"]
+            + ["-f", "null", "-"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+
 def test_getclips_uses_headless_env_and_gecko_path(monkeypatch, tmp_path):
     # Covers: TODO-TEST-CLIPS-GETCLIPS
     captured = {"service_path": None, "options": None, "quit_called": False}
@@ -1,6 +1,6 @@
 """
 Test Plan
-- Partitions: fill_duration success (real mp4), failure (VideoFileClip raises)
+- Partitions: fill_duration success (ffprobe, real mp4), failure (VideoFileClip raises)
 - Boundaries: duration_s > 0, JSON roundtrip includes duration_s
 - Failure modes: graceful handling when duration cannot be read (duration_s=None)
 """
@@ -105,3 +105,17 @@ def test_fill_duration_graceful_failure_sets_none_even_if_asset_had_value(
 
     fill_duration(asset)
     assert asset.duration_s is None
+
+
+def test_fill_duration_prefers_ffprobe(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """When ffprobe reports a duration, MoviePy is never opened."""
+    asset = _make_asset(str(tmp_path / "clip.mp4"))
+
+    def _raise(*_args, **_kwargs):
+        raise AssertionError("VideoFileClip should not be used when ffprobe succeeds")
+
+    monkeypatch.setattr("backend.clips.probe_duration_seconds", lambda _path: 7.25)
+    monkeypatch.setattr("backend.clips.VideoFileClip", _raise)
+
+    fill_duration(asset)
+    assert asset.duration_s == 7.25
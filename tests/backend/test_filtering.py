@@ -1,14 +1,25 @@
 """
 Test Plan
 - Partitions: dedupe by identity, max_per_streamer, missing streamer/views/title
-- Boundaries: empty list, exact dupes, query-param dupes, tie-break
+- Boundaries: empty list, exact dupes, query-param dupes, scheme case, ;params, tie-break
 - Defect: input list not mutated
 """
 
 import pytest
 
 from backend.models.clips import ClipRef
-from backend.filtering import clip_identity, filter_clips, normalize_clip_url
+from backend.clip_models import clip_identity, normalize_clip_url
+from backend.filtering import filter_clips
+
+
+@pytest.fixture(autouse=True)
+def _fresh_url_caches():
+    """Memoized URL helpers start empty in every test, so cache stats are per-test."""
+    normalize_clip_url.cache_clear()
+    clip_identity.cache_clear()
+    yield
+    normalize_clip_url.cache_clear()
+    clip_identity.cache_clear()
 
 
 # ---- URL helpers ----
@@ -32,6 +43,21 @@ def test_normalize_clip_url_both() -> None:
     assert normalize_clip_url(url) == "https://www.twitch.tv/x/clip/Abc123"
 
 
+def test_normalize_clip_url_lowercases_scheme() -> None:
+    """Scheme case does not split identities (urlparse lowercases it)."""
+    url = "HTTPS://www.twitch.tv/x/clip/Abc123?t=0"
+    assert normalize_clip_url(url) == "https://www.twitch.tv/x/clip/Abc123"
+    assert clip_identity("HTTPS://www.twitch.tv/x/some/path") == clip_identity(
+        "https://www.twitch.tv/x/some/path"
+    )
+
+
+def test_normalize_clip_url_removes_path_params() -> None:
+    """;params on the last path segment are removed, as urlparse splits them off."""
+    url = "https://www.twitch.tv/x/clip/Abc123;foo=bar"
+    assert normalize_clip_url(url) == "https://www.twitch.tv/x/clip/Abc123"
+
+
 def test_clip_identity_uses_last_segment_after_clip() -> None:
     """Identity is last path segment after /clip/ when present."""
     url = "https://www.twitch.tv/user/clip/AbcDef123"
@@ -51,6 +77,14 @@ def test_clip_identity_same_for_query_params() -> None:
     assert clip_identity(a) == clip_identity(b) == "Slug"
 
 
+def test_url_helpers_memoize() -> None:
+    """Repeat lookups hit the cache."""
+    url = "https://www.twitch.tv/x/clip/Cached?t=1"
+    assert clip_identity(url) == clip_identity(url) == "Cached"
+    assert clip_identity.cache_info().hits == 1
+    assert normalize_clip_url.cache_info().currsize == 1
+
+
 # ---- filter_clips ----
 
 
@@ -148,6 +182,8 @@ def test_filter_clips_does_not_mutate_input() -> None:
     assert len(original) == original_len
     assert original[0] is a
     assert original[1] is b
+    assert result is not original
+    assert result[0] is a and result[1] is b
 
 
 def test_filter_clips_empty_list() -> None:
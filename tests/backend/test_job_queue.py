@@ -1,12 +1,18 @@
 """
 Test Plan
-- Partitions: create_job, enqueue/dequeue, get, list_jobs, dedupe
+- Partitions: create_job, enqueue/dequeue, get, list_jobs, dedupe, concurrent enqueue
 - Boundaries: empty queue dequeue returns None; list_jobs with/without filter
 - Failure modes: get unknown id returns None
 
 Covers: TODO-JOBS-002
 """
 
+import copy
+import dataclasses
+import pickle
+import threading
+from datetime import datetime, timezone
+
 from backend.job_queue import InMemoryJobQueue
 from backend.models.jobs import Job, JobStatus
 
@@ -86,3 +92,67 @@ def test_enqueue_does_not_duplicate_same_job() -> None:
     second = q.dequeue()
     assert first is job
     assert second is None
+
+
+def test_concurrent_enqueue_keeps_dedupe_and_fifo_consistent() -> None:
+    """Validation: threads enqueueing the same job race the dedupe check under one lock."""
+    q = InMemoryJobQueue()
+    job = q.create_job("clip_montage")
+    others = [q.create_job("clip_montage") for _ in range(8)]
+    start = threading.Barrier(len(others) + 8)
+
+    def _enqueue(target: Job) -> None:
+        start.wait()
+        for _ in range(200):
+            q.enqueue(target)
+
+    threads = [threading.Thread(target=_enqueue, args=(job,)) for _ in range(8)]
+    threads += [threading.Thread(target=_enqueue, args=(other,)) for other in others]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    drained = []
+    while (next_job := q.dequeue()) is not None:
+        drained.append(next_job)
+    assert sorted(j.id for j in drained) == sorted(j.id for j in [job, *others])
+
+
+def test_list_jobs_status_filter_follows_lifecycle() -> None:
+    """Validation: list_jobs(status) reflects start/succeed/fail in insertion order."""
+    q = InMemoryJobQueue()
+    ok = q.create_job("clip_montage")
+    bad = q.create_job("clip_montage")
+    external = Job(type="vod_highlights")
+    q.enqueue(external)
+    now = datetime.now(timezone.utc)
+    ok.start(now)
+    bad.start(now)
+    assert q.list_jobs(JobStatus.RUNNING) == [ok, bad]
+    ok.succeed({"out": "x"}, now)
+    bad.fail("boom", now)
+    assert q.list_jobs(JobStatus.RUNNING) == []
+    assert q.list_jobs(JobStatus.DONE) == [ok]
+    assert q.list_jobs(JobStatus.FAILED) == [bad]
+    assert q.list_jobs(JobStatus.QUEUED) == [external]
+
+
+def test_list_jobs_snapshot_refreshes_and_returns_copies() -> None:
+    """Defect: cached snapshot picks up new jobs; callers may mutate the returned list."""
+    q = InMemoryJobQueue()
+    j1 = q.create_job("clip_montage")
+    first = q.list_jobs()
+    first.clear()
+    assert q.list_jobs() == [j1]
+    j2 = q.create_job("clip_montage")
+    assert q.list_jobs() == [j1, j2]
+
+
+def test_stored_job_stays_a_plain_dataclass() -> None:
+    """Defect: storing a job must not attach queue state (locks) that breaks copying."""
+    q = InMemoryJobQueue()
+    job = q.create_job("clip_montage", params={"streamers": ["a"]})
+    assert dataclasses.asdict(job)["params"] == {"streamers": ["a"]}
+    assert copy.deepcopy(job) == job
+    assert pickle.loads(pickle.dumps(job)) == job
@@ -0,0 +1,45 @@
+"""
+Test Plan
+- Partitions: orjson fast path vs stdlib fallback, indented vs compact output
+- Boundaries: non-ASCII text, bytes and str input to loads
+- Failure modes: invalid JSON raises json.JSONDecodeError on both paths
+"""
+
+import json
+
+import pytest
+
+from backend import json_codec
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    """Run each test against the orjson path (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        if json_codec.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec
+
+
+def test_dumps_returns_utf8_bytes_without_ascii_escaping(codec) -> None:
+    """Validation: output is bytes and non-ASCII text is kept as UTF-8."""
+    encoded = codec.dumps({"title": "día", "views": 3})
+    assert isinstance(encoded, bytes)
+    assert encoded == '{"title":"día","views":3}'.encode("utf-8")
+
+
+def test_dumps_indent_round_trips(codec) -> None:
+    """Validation: indented output is multi-line and decodes back to the same data."""
+    data = {"a": [1, 2], "b": None}
+    encoded = codec.dumps(data, indent=True)
+    assert b"\n  " in encoded
+    assert codec.loads(encoded) == data
+    assert codec.loads(encoded.decode("utf-8")) == data
+
+
+def test_loads_invalid_raises_json_decode_error(codec) -> None:
+    """Defect: malformed input raises json.JSONDecodeError on both paths."""
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
@@ -0,0 +1,62 @@
+"""
+Test Plan
+- Partitions: ffprobe missing, ffprobe success, ffprobe failure
+- Boundaries: "N/A" / zero duration output, subprocess timeout
+- Failure modes: every failure path returns None instead of raising
+"""
+
+import subprocess
+from unittest import mock
+
+import pytest
+
+from backend import media_probe
+
+
+@pytest.fixture
+def ffprobe_on_path(monkeypatch):
+    monkeypatch.setattr(media_probe, "ffprobe_available", lambda: True)
+
+
+def _completed(stdout: str) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=["ffprobe"], returncode=0, stdout=stdout, stderr="")
+
+
+def test_probe_duration_returns_none_without_ffprobe(monkeypatch) -> None:
+    """Boundary: no ffprobe on PATH means no subprocess call and None."""
+    monkeypatch.setattr(media_probe, "ffprobe_available", lambda: False)
+    with mock.patch("backend.media_probe.subprocess.run") as run:
+        assert media_probe.probe_duration_seconds("clip.mp4") is None
+    run.assert_not_called()
+
+
+def test_probe_duration_parses_stdout(ffprobe_on_path) -> None:
+    """Validation: ffprobe's bare duration value is parsed as seconds."""
+    with mock.patch(
+        "backend.media_probe.subprocess.run", return_value=_completed("12.480000\n")
+    ) as run:
+        assert media_probe.probe_duration_seconds("clip.mp4") == pytest.approx(12.48)
+    cmd = run.call_args[0][0]
+    assert cmd[0] == "ffprobe"
+    assert cmd[-1] == "clip.mp4"
+
+
+@pytest.mark.parametrize("stdout", ["N/A\n", "0.000000\n", ""])
+def test_probe_duration_unusable_output_returns_none(ffprobe_on_path, stdout: str) -> None:
+    """Boundary: missing or non-positive durations are reported as None."""
+    with mock.patch("backend.media_probe.subprocess.run", return_value=_completed(stdout)):
+        assert media_probe.probe_duration_seconds("clip.mp4") is None
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        subprocess.CalledProcessError(1, ["ffprobe"]),
+        subprocess.TimeoutExpired(["ffprobe"], 10),
+        FileNotFoundError("ffprobe"),
+    ],
+)
+def test_probe_duration_subprocess_failure_returns_none(ffprobe_on_path, error) -> None:
+    """Failure mode: ffprobe errors and timeouts do not propagate."""
+    with mock.patch("backend.media_probe.subprocess.run", side_effect=error):
+        assert media_probe.probe_duration_seconds("clip.mp4") is None
@@ -61,6 +61,7 @@ def test_compile_creates_output(tmp_path: Path) -> None:
         ("0042alpha99.mp4", "alpha"),
         ("beta777.mp4", "beta"),
         ("no_digits.mp4", "no_digits"),
+        ("12s1mple0.5.mp4", "s1mple"),
     ],
 )
 def test_extract_streamer_name(filename: str, expected: str) -> None:
@@ -5,6 +5,8 @@ Test Plan
 - Failure modes: propagates MoviePy construction errors
 """
 
+from collections.abc import Iterator
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
@@ -12,20 +14,33 @@ import pytest
 from backend import overlay, transition
 
 
-def test_render_overlay_calls_write() -> None:
+@pytest.fixture
+def overlay_mocks() -> Iterator[SimpleNamespace]:
+    """Patch overlay's MoviePy classes; TextClip returns a fluent (self-returning) mock."""
+    with mock.patch.multiple(
+        "backend.overlay",
+        VideoFileClip=mock.DEFAULT,
+        TextClip=mock.DEFAULT,
+        CompositeVideoClip=mock.DEFAULT,
+    ) as patched:
+        text_instance = mock.Mock()
+        text_instance.with_position.return_value = text_instance
+        text_instance.with_duration.return_value = text_instance
+        patched["TextClip"].return_value = text_instance
+        yield SimpleNamespace(
+            video=patched["VideoFileClip"],
+            text=patched["TextClip"],
+            composite=patched["CompositeVideoClip"],
+            text_instance=text_instance,
+        )
+
+
+def test_render_overlay_calls_write(overlay_mocks: SimpleNamespace) -> None:
     # Covers: TODO-TEST-OVERLAY
-    with mock.patch("backend.overlay.VideoFileClip") as video_clip, mock.patch(
-        "backend.overlay.TextClip"
-    ) as text_clip, mock.patch("backend.overlay.CompositeVideoClip") as composite:
-        mock_text = mock.Mock()
-        mock_text.with_position.return_value = mock_text
-        mock_text.with_duration.return_value = mock_text
-        text_clip.return_value = mock_text
-        composite.return_value.write_videofile = mock.Mock()
-        overlay.render_overlay("input.mp4", "output.mp4", "hello")
-        composite.return_value.write_videofile.assert_called_once()
-        video_clip.assert_called_once_with("input.mp4")
-        text_clip.assert_called_once()
+    overlay.render_overlay("input.mp4", "output.mp4", "hello")
+    overlay_mocks.composite.return_value.write_videofile.assert_called_once()
+    overlay_mocks.video.assert_called_once_with("input.mp4")
+    overlay_mocks.text.assert_called_once()
 
 
 def test_one_transition_writes_file() -> None:
@@ -41,41 +56,30 @@ def test_one_transition_writes_file() -> None:
         mock_clip.write_videofile.assert_called_once()
 
 
-def test_render_overlay_passes_custom_parameters() -> None:
+def test_render_overlay_passes_custom_parameters(overlay_mocks: SimpleNamespace) -> None:
     # Covers: TODO-TEST-OVERLAY
-    with mock.patch("backend.overlay.VideoFileClip") as video_clip, mock.patch(
-        "backend.overlay.TextClip"
-    ) as text_clip, mock.patch("backend.overlay.CompositeVideoClip") as composite:
-        mock_text = mock.Mock()
-        mock_text.with_position.return_value = mock_text
-        mock_text.with_duration.return_value = mock_text
-        text_clip.return_value = mock_text
-        composite.return_value.write_videofile = mock.Mock()
-
-        overlay.render_overlay(
-            "input.mp4",
-            "output.mp4",
-            "hello",
-            position="top",
-            duration=0,
-            fps=15,
-        )
-
-        mock_text.with_position.assert_called_once_with("top")
-        mock_text.with_duration.assert_called_once_with(0)
-        composite.return_value.write_videofile.assert_called_once_with("output.mp4", fps=15)
-        video_clip.assert_called_once_with("input.mp4")
-
-
-def test_render_overlay_propagates_video_errors() -> None:
+    overlay.render_overlay(
+        "input.mp4",
+        "output.mp4",
+        "hello",
+        position="top",
+        duration=0,
+        fps=15,
+    )
+
+    overlay_mocks.text_instance.with_position.assert_called_once_with("top")
+    overlay_mocks.text_instance.with_duration.assert_called_once_with(0)
+    overlay_mocks.composite.return_value.write_videofile.assert_called_once_with(
+        "output.mp4", fps=15
+    )
+    overlay_mocks.video.assert_called_once_with("input.mp4")
+
+
+def test_render_overlay_propagates_video_errors(overlay_mocks: SimpleNamespace) -> None:
     # Covers: TODO-TEST-OVERLAY
-    with mock.patch(
-        "backend.overlay.VideoFileClip", side_effect=OSError("cannot read")
-    ), mock.patch("backend.overlay.TextClip"), mock.patch(
-        "backend.overlay.CompositeVideoClip"
-    ):
-        with pytest.raises(OSError, match="cannot read"):
-            overlay.render_overlay("bad.mp4", "out.mp4", "hello")
+    overlay_mocks.video.side_effect = OSError("cannot read")
+    with pytest.raises(OSError, match="cannot read"):
+        overlay.render_overlay("bad.mp4", "out.mp4", "hello")
 
 
 def test_one_transition_default_output_dir() -> None:
@@ -4,11 +4,14 @@ Test Plan
 - All tests offline: mock getclips and download_clip
 """
 
+from collections.abc import Iterator
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 
+from backend import pipeline
 from backend.clip_models import write_clip_metadata
 from backend.models.clips import ClipAsset, ClipRef
 from backend.pipeline import (
@@ -19,10 +22,49 @@ from backend.pipeline import (
 )
 
 
+@pytest.fixture(scope="module")
+def _patched_pipeline() -> Iterator[SimpleNamespace]:
+    """Patch getclips/download_clip/overlay once for the module (tests stay offline)."""
+    # Mock(spec=...) rather than MagicMock: tests only call these and inspect calls.
+    mocks = {
+        "getclips": Mock(spec=pipeline.getclips),
+        "download_clip": Mock(spec=pipeline.download_clip),
+        "overlay": Mock(spec=pipeline.overlay),
+    }
+    with patch.multiple("backend.pipeline", **mocks):
+        yield SimpleNamespace(**mocks)
+
+
+@pytest.fixture
+def pipeline_mocks(_patched_pipeline: SimpleNamespace) -> SimpleNamespace:
+    """Module-wide pipeline mocks, reset (including return values/side effects) per test."""
+    for mock in vars(_patched_pipeline).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _patched_pipeline
+
+
+@pytest.fixture(scope="module")
+def shared_videos_dir(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """One empty output dir for tests that write nothing (sidecar cache tests use tmp_path)."""
+    return str(tmp_path_factory.mktemp("pipeline"))
+
+
 def _make_ref(url: str, views: int | None = None, streamer: str = "x") -> ClipRef:
     return ClipRef(clip_url=url, streamer=streamer, views=views, title=None)
 
 
+# ClipRef is frozen, so these pools are built once and shared (each test copies the list).
+_REFS_30 = tuple(_make_ref(f"https://x/clip/{i}", views=100 - i) for i in range(30))
+_ALICE_REFS_25 = tuple(
+    _make_ref(f"https://x/clip/{i}", views=100 - i, streamer="alice") for i in range(25)
+)
+
+
+def _downloaded_refs(mocks: SimpleNamespace) -> list[ClipRef]:
+    """ClipRefs passed to download_clip, in call order."""
+    return [c.args[0] for c in mocks.download_clip.call_args_list]
+
+
 def _make_asset(ref: ClipRef, duration_s: float = 60.0) -> ClipAsset:
     """Assets need duration_s for duration-based selection (8–10 min target)."""
     return ClipAsset(
@@ -35,154 +77,118 @@ def _make_asset(ref: ClipRef, duration_s: float = 60.0) -> ClipAsset:
     )
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_only_top_n_passed_to_download(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """Only top N clips are passed to download_clip. Covers: TODO-RANK-004."""
-    refs = [_make_ref(f"https://x/clip/{i}", views=100 - i) for i in range(30)]
-    mock_getclips.return_value = refs
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.getclips.return_value = list(_REFS_30)
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
     scrape_filter_rank_download(
         ["alice"],
-        str(tmp_path),
+        shared_videos_dir,
         max_clips=5,
         scrape_pool_size=30,
     )
 
-    assert mock_download.call_count == 5
+    assert pipeline_mocks.download_clip.call_count == 5
     # Highest views first: 100, 99, 98, 97, 96
-    downloaded_views = [c[0][0].views for c in mock_download.call_args_list]
+    downloaded_views = [r.views for r in _downloaded_refs(pipeline_mocks)]
     assert downloaded_views == [100, 99, 98, 97, 96]
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_filter_applied_before_ranking(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """filter_clips is applied; duplicates are removed before ranking."""
     # Same identity (Slug), different query params; different identity (Other)
     dup1 = _make_ref("https://x/clip/Slug", views=10)
     dup2 = _make_ref("https://x/clip/Slug?t=0", views=500)  # higher views kept
     other = _make_ref("https://x/clip/Other", views=100)
-    mock_getclips.return_value = [dup1, dup2, other]
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.getclips.return_value = [dup1, dup2, other]
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
     scrape_filter_rank_download(
         ["alice"],
-        str(tmp_path),
+        shared_videos_dir,
         max_clips=10,
         scrape_pool_size=10,
     )
 
     # After dedupe: 2 refs (Slug with 500 views, Other with 100). Both downloaded.
-    assert mock_download.call_count == 2
-    urls = {c[0][0].clip_url for c in mock_download.call_args_list}
+    assert pipeline_mocks.download_clip.call_count == 2
+    urls = {r.clip_url for r in _downloaded_refs(pipeline_mocks)}
     assert "https://x/clip/Slug?t=0" in urls or "https://x/clip/Slug" in urls
     assert "https://x/clip/Other" in urls
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_ranking_order_determines_download_order(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """Download order follows rank (highest score first)."""
     low = _make_ref("https://x/clip/low", views=10)
     high = _make_ref("https://x/clip/high", views=5000)
-    mock_getclips.return_value = [low, high]
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.getclips.return_value = [low, high]
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
-    scrape_filter_rank_download(["alice"], str(tmp_path), max_clips=2)
+    scrape_filter_rank_download(["alice"], shared_videos_dir, max_clips=2)
 
-    call_order = [c[0][0].clip_url for c in mock_download.call_args_list]
+    call_order = [r.clip_url for r in _downloaded_refs(pipeline_mocks)]
     assert call_order[0] == "https://x/clip/high"
     assert call_order[1] == "https://x/clip/low"
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_empty_list_no_downloads(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """Empty streamer list or no clips: no downloads."""
-    mock_getclips.return_value = []
+    pipeline_mocks.getclips.return_value = []
 
-    scrape_filter_rank_download([], str(tmp_path))
-    assert mock_download.call_count == 0
+    scrape_filter_rank_download([], shared_videos_dir)
+    assert pipeline_mocks.download_clip.call_count == 0
 
-    scrape_filter_rank_download(["alice"], str(tmp_path))
-    assert mock_download.call_count == 0
+    scrape_filter_rank_download(["alice"], shared_videos_dir)
+    assert pipeline_mocks.download_clip.call_count == 0
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_does_not_mutate_input(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """streamer_names input is not mutated."""
-    mock_getclips.return_value = [_make_ref("https://x/clip/a", views=100)]
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.getclips.return_value = [_make_ref("https://x/clip/a", views=100)]
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
     streamers = ["alice", "bob"]
     original = list(streamers)
-    scrape_filter_rank_download(streamers, str(tmp_path))
+    scrape_filter_rank_download(streamers, shared_videos_dir)
 
     assert streamers == original
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_handles_missing_views_title(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """Missing views/title do not crash pipeline."""
     ref = ClipRef(clip_url="https://x/clip/a", streamer="x", views=None, title=None)
-    mock_getclips.return_value = [ref]
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.getclips.return_value = [ref]
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
-    result = scrape_filter_rank_download(["alice"], str(tmp_path), max_clips=5)
+    result = scrape_filter_rank_download(["alice"], shared_videos_dir, max_clips=5)
     assert len(result) == 1
 
 
 # ---- TODO-RANK-006 multi-streamer tests ----
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_per_streamer_k_limits_candidates_before_global_rank(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """Multi-streamer: only K per streamer considered before global rank. Covers: TODO-RANK-006."""
     # Each streamer returns 15 clips; per_streamer_k=5 means we keep 5 each (10 total) before global rank
@@ -192,31 +198,26 @@ def test_per_streamer_k_limits_candidates_before_global_rank(
             for i in range(15)
         ]
 
-    mock_getclips.side_effect = _getclips_side_effect
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.getclips.side_effect = _getclips_side_effect
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
     scrape_filter_rank_download(
         ["alice", "bob"],
-        str(tmp_path),
+        shared_videos_dir,
         max_clips=4,
         scrape_pool_size=15,
         per_streamer_k=5,
     )
 
     # Global rank picks top 4 from the 10 candidates (5 alice + 5 bob)
-    assert mock_download.call_count == 4
+    assert pipeline_mocks.download_clip.call_count == 4
     # getclips called once per streamer
-    assert mock_getclips.call_count == 2
+    assert pipeline_mocks.getclips.call_count == 2
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_global_ranking_still_controls_final_downloads(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """Downloads follow global rank order, not streamer order."""
     def _getclips_side_effect(name, **kwargs):
@@ -224,61 +225,50 @@ def test_global_ranking_still_controls_final_downloads(
             return [_make_ref("https://alice/clip/alice1", views=100, streamer="alice")]
         return [_make_ref("https://bob/clip/bob1", views=5000, streamer="bob")]
 
-    mock_getclips.side_effect = _getclips_side_effect
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.getclips.side_effect = _getclips_side_effect
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
     scrape_filter_rank_download(
         ["alice", "bob"],
-        str(tmp_path),
+        shared_videos_dir,
         max_clips=2,
         per_streamer_k=5,
     )
 
     # Bob's clip (5000 views) ranks higher than Alice's (100); bob first
-    call_order = [c[0][0].streamer for c in mock_download.call_args_list]
+    call_order = [r.streamer for r in _downloaded_refs(pipeline_mocks)]
     assert call_order[0] == "bob"
     assert call_order[1] == "alice"
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_single_streamer_path_unchanged(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
-    tmp_path: Path,
+    pipeline_mocks: SimpleNamespace,
+    shared_videos_dir: str,
 ) -> None:
     """Single streamer: same behavior as before (top max_clips from ranked list)."""
-    refs = [_make_ref(f"https://x/clip/{i}", views=100 - i, streamer="alice") for i in range(25)]
-    mock_getclips.return_value = refs
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.getclips.return_value = list(_ALICE_REFS_25)
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
     scrape_filter_rank_download(
         ["alice"],
-        str(tmp_path),
+        shared_videos_dir,
         max_clips=5,
         scrape_pool_size=25,
     )
 
     # Still gets top 5 by score (views)
-    assert mock_download.call_count == 5
-    downloaded_views = [c[0][0].views for c in mock_download.call_args_list]
+    assert pipeline_mocks.download_clip.call_count == 5
+    downloaded_views = [r.views for r in _downloaded_refs(pipeline_mocks)]
     assert downloaded_views == [100, 99, 98, 97, 96]
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_uses_cached_sidecar_asset_instead_of_redownloading(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
+    pipeline_mocks: SimpleNamespace,
     tmp_path: Path,
 ) -> None:
     """Cache hit: existing sidecar+mp4 for clip_url skips download_clip."""
     ref = _make_ref("https://x/clip/cached", views=100, streamer="alice")
-    mock_getclips.return_value = [ref]
+    pipeline_mocks.getclips.return_value = [ref]
     cached_mp4 = tmp_path / "cached.mp4"
     cached_mp4.write_text("mp4")
     cached_asset = ClipAsset(
@@ -293,23 +283,18 @@ def test_uses_cached_sidecar_asset_instead_of_redownloading(
 
     out = scrape_filter_rank_download(["alice"], str(tmp_path), max_clips=1, apply_overlay=False)
 
-    assert mock_download.call_count == 0
+    assert pipeline_mocks.download_clip.call_count == 0
     assert len(out) == 1
     assert out[0].output_path == str(cached_mp4)
 
 
-@patch("backend.pipeline.overlay")
-@patch("backend.pipeline.download_clip")
-@patch("backend.pipeline.getclips")
 def test_missing_cached_mp4_falls_back_to_download(
-    mock_getclips: MagicMock,
-    mock_download: MagicMock,
-    mock_overlay: MagicMock,
+    pipeline_mocks: SimpleNamespace,
     tmp_path: Path,
 ) -> None:
     """Cache miss: sidecar with missing mp4 path triggers fresh download."""
     ref = _make_ref("https://x/clip/missing", views=100, streamer="alice")
-    mock_getclips.return_value = [ref]
+    pipeline_mocks.getclips.return_value = [ref]
     missing_asset = ClipAsset(
         clip_ref=ref,
         mp4_url="https://cdn.example.com/missing.mp4",
@@ -319,9 +304,9 @@ def test_missing_cached_mp4_falls_back_to_download(
         created_at=None,
     )
     write_clip_metadata(missing_asset)
-    mock_download.side_effect = lambda r, **_: _make_asset(r)
+    pipeline_mocks.download_clip.side_effect = lambda r, **_: _make_asset(r)
 
     out = scrape_filter_rank_download(["alice"], str(tmp_path), max_clips=1, apply_overlay=False)
 
-    assert mock_download.call_count == 1
+    assert pipeline_mocks.download_clip.call_count == 1
     assert len(out) == 1
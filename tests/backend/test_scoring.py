@@ -5,9 +5,11 @@ Test Plan
 - Ordering: higher views => higher score (all else equal)
 """
 
+import random
 from datetime import datetime, timezone
 
 import pytest
+from _ranking_harness import assert_rank_does_not_mutate, assert_rank_empty, assert_ranked_desc
 
 from backend.models.clips import ClipRef
 from backend.models.vod import Segment
@@ -25,22 +27,36 @@ def test_score_clip_higher_views_scores_higher() -> None:
     assert score_clip(high, now=FIXED_NOW) > score_clip(low, now=FIXED_NOW)
 
 
-def test_score_clip_negative_views_treated_as_zero() -> None:
-    """Defect: negative views must not crash; treated as 0."""
-    ref = ClipRef(clip_url="https://x/a", streamer="x", views=-100, title=None)
+_ZERO = "zero"
+_POSITIVE = "positive"
+
+
+@pytest.mark.parametrize(
+    ("views", "title", "expected"),
+    [
+        (-100, None, _ZERO),
+        (None, "Epic", _ZERO),
+        (0, None, _ZERO),
+        (1000, None, _POSITIVE),
+        (5000, "Epic play highlight", _POSITIVE),
+    ],
+    ids=[
+        "negative_views",
+        "missing_views",
+        "zero_views_no_title",
+        "missing_title",
+        "normal_input",
+    ],
+)
+def test_score_clip_scalar_cases(views: int | None, title: str | None, expected: str) -> None:
+    """Defect/boundary: bad or missing views score as log1p(0) = 0; typical refs are positive."""
+    ref = ClipRef(clip_url="https://x/clip/a", streamer="x", views=views, title=title)
     s = score_clip(ref, now=FIXED_NOW)
-    assert s >= 0
-    assert abs(s) < 1e-9  # same as views=0
-
-
-def test_score_clip_missing_views_treated_as_zero() -> None:
-    """Missing views must not crash; treated as 0."""
-    ref = ClipRef(clip_url="https://x/clip/a", streamer="x", views=None, title="Epic")
-    s = score_clip(ref, now=FIXED_NOW)
-    assert s >= 0
     assert isinstance(s, float)
-    # With no keywords, score = log1p(0) = 0
-    assert abs(s) < 1e-9
+    if expected == _ZERO:
+        assert abs(s) < 1e-9
+    else:
+        assert s > 0
 
 
 def test_score_clip_keyword_bonus_increases_score() -> None:
@@ -65,19 +81,10 @@ def test_score_clip_keyword_bonus_capped() -> None:
     assert bonus_portion > 0
 
 
-def test_score_clip_boundary_views_zero_title_none() -> None:
-    """Boundary: views=0 and title=None yields minimal score, no crash."""
-    ref = ClipRef(clip_url="https://x/a", views=0, title=None)
-    s = score_clip(ref, now=FIXED_NOW)
-    assert abs(s) < 1e-9
-
-
-def test_score_clip_missing_title_no_crash() -> None:
+def test_score_clip_missing_title_gets_no_keyword_bonus() -> None:
     """Missing title must not crash; no keyword bonus."""
     ref = ClipRef(clip_url="https://x/a", views=1000, title=None)
-    s = score_clip(ref, now=FIXED_NOW, keywords=["epic"])
-    assert s > 0
-    assert s == score_clip(ref, now=FIXED_NOW)  # same as no keywords
+    assert score_clip(ref, now=FIXED_NOW, keywords=["epic"]) == score_clip(ref, now=FIXED_NOW)
 
 
 def test_score_clip_deterministic_fixed_now() -> None:
@@ -88,19 +95,6 @@ def test_score_clip_deterministic_fixed_now() -> None:
     assert a == b
 
 
-def test_score_clip_normal_input_positive() -> None:
-    """Typical ClipRef produces positive score."""
-    ref = ClipRef(
-        clip_url="https://x/clip/abc",
-        streamer="x",
-        views=5000,
-        title="Epic play highlight",
-    )
-    s = score_clip(ref, now=FIXED_NOW)
-    assert s > 0
-    assert isinstance(s, float)
-
-
 # ---- rank_clips tests (TODO-RANK-002) ----
 
 
@@ -150,21 +144,14 @@ def test_rank_clips_tie_break_same_score_and_views_uses_url() -> None:
     assert [r.clip_url for r in result] == ["https://x/a", "https://x/b"]
 
 
-def test_rank_clips_does_not_mutate_input() -> None:
-    """Input list is not mutated."""
-    a = ClipRef(clip_url="https://x/a", views=100, title=None)
-    b = ClipRef(clip_url="https://x/b", views=500, title=None)
-    original = [a, b]
-    original_ids = [id(c) for c in original]
-    result = rank_clips(original, now=FIXED_NOW)
-    assert result != original  # different list object
-    assert original == [a, b]  # order unchanged
-    assert [id(c) for c in original] == original_ids  # same refs
-
-
-def test_rank_clips_empty_list() -> None:
-    """Handles empty list."""
-    assert rank_clips([], now=FIXED_NOW) == []
+def test_rank_clips_does_not_mutate_input_and_handles_empty() -> None:
+    """Input list is not mutated; empty list ranks to empty."""
+    refs = [
+        ClipRef(clip_url="https://x/a", views=100, title=None),
+        ClipRef(clip_url="https://x/b", views=500, title=None),
+    ]
+    assert_rank_does_not_mutate(lambda xs: rank_clips(xs, now=FIXED_NOW), refs)
+    assert_rank_empty(lambda xs: rank_clips(xs, now=FIXED_NOW))
 
 
 def test_rank_clips_missing_views_title_safe() -> None:
@@ -181,6 +168,27 @@ def test_rank_clips_missing_views_title_safe() -> None:
     assert result[2].clip_url == "https://x/a"
 
 
+def test_rank_clips_properties_on_seeded_random_inputs() -> None:
+    """Properties: rank is a permutation, scores non-increasing, more views => higher score."""
+    rng = random.Random(1234)
+    for _ in range(50):
+        refs = [
+            ClipRef(
+                clip_url=f"https://x/clip/{rng.randrange(10_000)}",
+                views=rng.choice([None, rng.randint(-100, 10_000)]),
+                title=rng.choice([None, "epic moment", "chill"]),
+            )
+            for _ in range(rng.randint(0, 12))
+        ]
+        ranked = rank_clips(refs, now=FIXED_NOW, keywords=["epic"])
+        assert sorted(map(id, ranked)) == sorted(map(id, refs))
+        assert_ranked_desc(ranked, lambda r: score_clip(r, now=FIXED_NOW, keywords=["epic"]))
+        for ref in refs:
+            views = max(ref.views or 0, 0)
+            more = ClipRef(clip_url=ref.clip_url, views=views + 1, title=ref.title)
+            assert score_clip(more, now=FIXED_NOW) > score_clip(ref, now=FIXED_NOW)
+
+
 def test_keyword_bonus_parity_between_clip_and_segment_paths() -> None:
     """Shared keyword-bonus math is consistent across both wrappers."""
     keywords = ["pog", "wow"]
@@ -203,3 +211,12 @@ def test_keyword_bonus_parity_between_clip_and_segment_paths() -> None:
         keyword_cap=10.0,
     )
     assert clip_bonus == pytest.approx(segment_bonus)
+
+
+def test_score_clip_negative_keyword_bonus_counts_every_match() -> None:
+    """Negative bonus never saturates the cap, so every matching keyword still applies."""
+    ref = ClipRef(clip_url="https://x/clip/a", streamer="x", views=None, title="gg ez clutch")
+    kwargs = {"now": FIXED_NOW, "keyword_cap": -3.0}
+    one = score_clip(ref, keywords=["gg"], keyword_bonus=-2.0, **kwargs)
+    three = score_clip(ref, keywords=["gg", "ez", "clutch"], keyword_bonus=-2.0, **kwargs)
+    assert three - one == pytest.approx(-3.0)  # min(-2, -3)=-3 vs min(-6, -3)=-6
@@ -7,9 +7,11 @@ Test Plan
 Covers: TODO-VOD-004
 """
 
+import random
 from datetime import datetime, timezone
 
 import pytest
+from _ranking_harness import assert_rank_does_not_mutate, assert_rank_empty, assert_ranked_desc
 
 from backend.models.clips import ClipRef
 from backend.models.vod import Segment
@@ -22,7 +24,7 @@ FIXED_NOW = datetime(2025, 2, 14, 12, 0, 0, tzinfo=timezone.utc)
 def test_score_segment_base_is_spike_score() -> None:
     """Without keyword inputs, score is spike score only."""
     segment = Segment(start_s=0.0, end_s=5.0, spike_score=12.0)
-    assert score_segment(segment) == pytest.approx(12.0)
+    assert score_segment(segment) == 12.0
 
 
 def test_score_segment_keyword_bonus_applies_case_insensitive() -> None:
@@ -34,7 +36,7 @@ def test_score_segment_keyword_bonus_applies_case_insensitive() -> None:
         keywords=["pog", "WOW"],
         keyword_bonus=2.5,
     )
-    assert score == pytest.approx(15.0)
+    assert score == 15.0
 
 
 def test_score_segment_keyword_bonus_capped() -> None:
@@ -47,24 +49,27 @@ def test_score_segment_keyword_bonus_capped() -> None:
         keyword_bonus=5.0,
         keyword_cap=12.0,
     )
-    assert score == pytest.approx(15.0)
+    assert score == 15.0
 
 
 def test_score_segment_handles_none_context_or_keywords() -> None:
     """None/empty inputs for context/keywords should not crash or add bonus."""
     segment = Segment(start_s=0.0, end_s=5.0, spike_score=7.0)
-    assert score_segment(segment, context_text=None, keywords=["x"]) == pytest.approx(7.0)
-    assert score_segment(segment, context_text="x", keywords=None) == pytest.approx(7.0)
-    assert score_segment(segment, context_text="x", keywords=[]) == pytest.approx(7.0)
+    assert score_segment(segment, context_text=None, keywords=["x"]) == 7.0
+    assert score_segment(segment, context_text="x", keywords=None) == 7.0
+    assert score_segment(segment, context_text="x", keywords=[]) == 7.0
 
 
-def test_score_segment_rejects_negative_bonus_or_cap() -> None:
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"keyword_bonus": -0.1}, {"keyword_cap": -1.0}],
+    ids=["keyword_bonus", "keyword_cap"],
+)
+def test_score_segment_rejects_negative_bonus_or_cap(kwargs: dict[str, float]) -> None:
     """Negative bonus or cap values are invalid."""
     segment = Segment(start_s=0.0, end_s=5.0, spike_score=1.0)
-    with pytest.raises(ValueError, match="keyword_bonus"):
-        score_segment(segment, keyword_bonus=-0.1)
-    with pytest.raises(ValueError, match="keyword_cap"):
-        score_segment(segment, keyword_cap=-1.0)
+    with pytest.raises(ValueError, match=next(iter(kwargs))):
+        score_segment(segment, **kwargs)
 
 
 def test_rank_segments_sorts_by_score_desc() -> None:
@@ -109,15 +114,29 @@ def test_rank_segments_final_tie_break_preserves_input_index() -> None:
     assert ranked == [second, first]
 
 
-def test_rank_segments_does_not_mutate_input() -> None:
-    """Input list order stays unchanged after ranking call."""
+def test_rank_segments_order_independent_of_input_order_for_distinct_keys() -> None:
+    """Property: with distinct (start_s, end_s), ranking ignores input order (seeded shuffles)."""
+    rng = random.Random(42)
+    for _ in range(50):
+        bounds = rng.sample([(s, s + d) for s in range(0, 100, 5) for d in (5, 10)], k=8)
+        segments = [
+            Segment(start_s=float(s), end_s=float(e), spike_score=float(rng.randint(0, 3)))
+            for s, e in bounds
+        ]
+        shuffled = rng.sample(segments, k=len(segments))
+        expected = [id(seg) for seg in rank_segments(segments)]
+        assert [id(seg) for seg in rank_segments(shuffled)] == expected
+
+
+def test_rank_segments_does_not_mutate_input_and_handles_empty() -> None:
+    """Input list order stays unchanged after ranking call; empty input ranks to empty."""
     segments = [
         Segment(start_s=10.0, end_s=15.0, spike_score=1.0),
         Segment(start_s=0.0, end_s=5.0, spike_score=2.0),
     ]
-    snapshot = list(segments)
-    _ = rank_segments(segments)
-    assert segments == snapshot
+    assert_rank_does_not_mutate(rank_segments, segments)
+    assert_rank_empty(rank_segments)
+    assert_ranked_desc(rank_segments(segments), score_segment)
 
 
 def test_rank_segments_contexts_by_index_work() -> None:
@@ -166,8 +185,8 @@ def test_keyword_bonus_cap_parity_between_clip_and_segment_paths() -> None:
         keyword_bonus=10.0,
         keyword_cap=15.0,
     )
-    assert clip_score == pytest.approx(15.0)
-    assert segment_score == pytest.approx(15.0)
+    assert clip_score == 15.0
+    assert segment_score == 15.0
 
 
 def test_keyword_bonus_case_insensitive_parity_between_paths() -> None:
@@ -5,6 +5,7 @@ Test Plan
 - Failure modes: input not mutated
 """
 
+import random
 from pathlib import Path
 
 import pytest
@@ -271,6 +272,33 @@ def test_non_overlapping_selector_prefers_timeline_diversity_windows() -> None:
     ]
 
 
+def test_non_overlapping_selector_random_picks_are_disjoint_and_maximal() -> None:
+    """Property: picks are pairwise disjoint; every skipped valid segment overlaps or overflows."""
+    rng = random.Random(1234)
+    ranked = []
+    for _ in range(300):
+        start = rng.uniform(0.0, 3600.0)
+        ranked.append(Segment(start_s=start, end_s=start + rng.uniform(5.0, 90.0), spike_score=0.0))
+
+    # Unreachable min_seconds forces both passes over the full ranked list.
+    selected = select_non_overlapping_segments_for_duration(
+        ranked, min_seconds=10**9, max_seconds=1800
+    )
+
+    ordered = sorted(selected, key=lambda segment: segment.start_s)
+    assert all(a.end_s <= b.start_s for a, b in zip(ordered, ordered[1:]))
+    total = sum(segment.end_s - segment.start_s for segment in selected)
+    assert total <= 1800
+    picked = {id(segment) for segment in selected}
+    for segment in ranked:
+        if id(segment) in picked:
+            continue
+        overlaps = any(
+            segment.start_s < other.end_s and other.start_s < segment.end_s for other in selected
+        )
+        assert overlaps or total + (segment.end_s - segment.start_s) > 1800
+
+
 @pytest.mark.skipif(
     not (Path(__file__).parent.parent / "media" / "sample_clip_1.mp4").exists(),
     reason="Run python scripts/generate_test_media.py",
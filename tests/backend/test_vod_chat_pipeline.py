@@ -8,6 +8,7 @@ Covers: TODO-VOD-006
 """
 
 import json
+import random
 from pathlib import Path
 
 import pytest
@@ -53,6 +54,29 @@ def test_build_segment_contexts_deterministic_order() -> None:
     assert contexts[0] == "first second third"
 
 
+def test_build_segment_contexts_matches_linear_scan_on_random_input() -> None:
+    """Property: shuffled messages and many segments match the per-segment linear scan."""
+    rng = random.Random(7)
+    messages = [
+        ChatMessage(timestamp_s=float(rng.randint(0, 600)), message=f"m{i}") for i in range(400)
+    ]
+    segments = [
+        Segment(start_s=float(start), end_s=float(start + rng.randint(1, 40)), spike_score=1.0)
+        for start in (rng.randint(0, 620) for _ in range(30))
+    ]
+
+    contexts = build_segment_contexts(messages, segments, context_window_s=5)
+
+    expected = {}
+    for idx, segment in enumerate(segments):
+        matched = [
+            m.message for m in messages if segment.start_s - 5 <= m.timestamp_s <= segment.end_s + 5
+        ]
+        if matched:
+            expected[idx] = " ".join(matched)
+    assert contexts == expected
+
+
 def test_chat_messages_to_ranked_segments_empty_returns_empty() -> None:
     """Empty message input short-circuits to empty segment output."""
     ranked = chat_messages_to_ranked_segments(
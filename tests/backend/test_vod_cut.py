@@ -1,10 +1,11 @@
 """
 Test Plan
-- Partitions: ffmpeg available/missing, valid vod path/invalid, segment count limits, skips short segments
+- Partitions: ffmpeg available/missing, valid vod path/invalid, segment count limits, skips short segments, batched ffmpeg runs
 - Boundaries: empty segments list, single segment, min_segment_seconds=1.0
 - Failure modes: missing ffmpeg, file not found, invalid file type, ffmpeg subprocess failure
 """
 
+import subprocess
 from pathlib import Path
 from unittest import mock
 
@@ -17,6 +18,24 @@ from backend.models.vod import Segment
 # Covers: TODO-VOD-008
 
 
+@pytest.fixture(autouse=True)
+def _fresh_ffmpeg_lookup():
+    """ffmpeg_available is memoized; drop the cache around each test that patches which()."""
+    ffmpeg_available.cache_clear()
+    yield
+    ffmpeg_available.cache_clear()
+
+
+def _output_paths(cmd: list[str]) -> list[str]:
+    """Output files of a (batched) ffmpeg command: .mp4 tokens that are not -i inputs."""
+    return [token for prev, token in zip(cmd, cmd[1:]) if token.endswith(".mp4") and prev != "-i"]
+
+
+def _write_outputs(cmd: list[str]) -> None:
+    for output_path in _output_paths(cmd):
+        Path(output_path).write_bytes(b"fake segment")
+
+
 def test_ffmpeg_available_returns_true_when_found(monkeypatch) -> None:
     """ffmpeg_available returns True when ffmpeg is on PATH."""
     monkeypatch.setattr("backend.vod_cut.shutil.which", lambda x: "ffmpeg")
@@ -29,6 +48,20 @@ def test_ffmpeg_available_returns_false_when_missing(monkeypatch) -> None:
     assert ffmpeg_available() is False
 
 
+def test_ffmpeg_available_looks_up_path_once(monkeypatch) -> None:
+    """Repeated checks reuse the first PATH lookup."""
+    lookups: list[str] = []
+
+    def _which(name: str) -> str:
+        lookups.append(name)
+        return "ffmpeg"
+
+    monkeypatch.setattr("backend.vod_cut.shutil.which", _which)
+    assert ffmpeg_available() is True
+    assert ffmpeg_available() is True
+    assert lookups == ["ffmpeg"]
+
+
 def test_cut_segments_raises_when_vod_path_missing(tmp_path) -> None:
     """cut_segments raises ValueError if vod_path does not exist."""
     vod_path = str(tmp_path / "nonexistent.mp4")
@@ -70,16 +103,14 @@ def test_cut_segments_uses_ffmpeg_subprocess_mocked(tmp_path, monkeypatch) -> No
     vod_path.write_bytes(b"fake video content")
 
     # Mock subprocess.run to track calls and create output files
-    original_run = None
+    commands: list[list[str]] = []
 
     def mock_run(cmd, **kwargs):
         # Verify correct arguments
         assert cmd[0] == "ffmpeg"
         assert cmd[1] == "-y"
-        # Create fake output file
-        output_idx = cmd.index("-o") if "-o" in cmd else len(cmd) - 1
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake segment")
+        commands.append(cmd)
+        _write_outputs(cmd)
         # Return success
         result = mock.Mock()
         result.returncode = 0
@@ -104,6 +135,12 @@ def test_cut_segments_uses_ffmpeg_subprocess_mocked(tmp_path, monkeypatch) -> No
     assert all(Path(p).exists() for p in output_paths)
     assert output_paths[0].endswith("segment_000_0_10.mp4")
     assert output_paths[1].endswith("segment_001_15_25.mp4")
+    # Both cuts share one ffmpeg process; each is an input-seeked (-ss/-t before -i) read.
+    assert len(commands) == 1
+    cmd = commands[0]
+    assert cmd[2:8] == ["-ss", "0.0", "-t", "10.0", "-i", str(vod_path)]
+    assert cmd[8:14] == ["-ss", "15.0", "-t", "10.0", "-i", str(vod_path)]
+    assert _output_paths(cmd) == output_paths
 
 
 def test_cut_segments_respects_max_segments(tmp_path, monkeypatch) -> None:
@@ -114,8 +151,7 @@ def test_cut_segments_respects_max_segments(tmp_path, monkeypatch) -> None:
     vod_path.write_bytes(b"fake video")
 
     def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake segment")
+        _write_outputs(cmd)
         result = mock.Mock()
         result.returncode = 0
         return result
@@ -150,8 +186,7 @@ def test_cut_segments_skips_too_short_segments(tmp_path, monkeypatch) -> None:
     def mock_run(cmd, **kwargs):
         nonlocal call_count
         call_count += 1
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake segment")
+        _write_outputs(cmd)
         result = mock.Mock()
         result.returncode = 0
         return result
@@ -172,7 +207,8 @@ def test_cut_segments_skips_too_short_segments(tmp_path, monkeypatch) -> None:
     )
 
     assert len(output_paths) == 2
-    assert call_count == 2
+    # Kept segments are cut by a single ffmpeg process.
+    assert call_count == 1
 
 
 def test_cut_segments_creates_output_directory(tmp_path, monkeypatch) -> None:
@@ -184,8 +220,7 @@ def test_cut_segments_creates_output_directory(tmp_path, monkeypatch) -> None:
     output_dir = tmp_path / "nested" / "output"
 
     def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake segment")
+        _write_outputs(cmd)
         result = mock.Mock()
         result.returncode = 0
         return result
@@ -211,8 +246,7 @@ def test_cut_segments_does_not_mutate_input(tmp_path, monkeypatch) -> None:
     vod_path.write_bytes(b"fake video")
 
     def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake segment")
+        _write_outputs(cmd)
         result = mock.Mock()
         result.returncode = 0
         return result
@@ -252,6 +286,51 @@ def test_cut_segments_empty_list_returns_empty(tmp_path, monkeypatch) -> None:
     assert output_paths == []
 
 
+def test_cut_segments_batches_ffmpeg_processes(tmp_path, monkeypatch) -> None:
+    """Many kept segments are split across ffmpeg runs of at most 16 cuts each."""
+    monkeypatch.setattr("backend.vod_cut.shutil.which", lambda x: "ffmpeg")
+
+    vod_path = tmp_path / "vod.mp4"
+    vod_path.write_bytes(b"fake video")
+    outputs_per_call: list[int] = []
+
+    def mock_run(cmd, **kwargs):
+        outputs_per_call.append(len(_output_paths(cmd)))
+        _write_outputs(cmd)
+        return mock.Mock(returncode=0)
+
+    monkeypatch.setattr("backend.vod_cut.subprocess.run", mock_run)
+
+    segments = [Segment(start_s=10.0 * i, end_s=10.0 * i + 5.0, spike_score=1.0) for i in range(20)]
+
+    output_paths = cut_segments(str(vod_path), segments, output_dir=str(tmp_path))
+
+    assert outputs_per_call == [16, 4]
+    assert len(output_paths) == 20
+    assert all(Path(p).exists() for p in output_paths)
+
+
+def test_cut_segments_raises_runtime_error_on_ffmpeg_failure(tmp_path, monkeypatch) -> None:
+    """A failing ffmpeg run surfaces as RuntimeError naming the batch's segment indices."""
+    monkeypatch.setattr("backend.vod_cut.shutil.which", lambda x: "ffmpeg")
+
+    vod_path = tmp_path / "vod.mp4"
+    vod_path.write_bytes(b"fake video")
+
+    def mock_run(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, stderr="moov atom not found")
+
+    monkeypatch.setattr("backend.vod_cut.subprocess.run", mock_run)
+
+    segments = [
+        Segment(start_s=0.0, end_s=10.0, spike_score=1.0),
+        Segment(start_s=15.0, end_s=25.0, spike_score=1.0),
+    ]
+
+    with pytest.raises(RuntimeError, match="segments 0, 1: moov atom not found"):
+        cut_segments(str(vod_path), segments, output_dir=str(tmp_path))
+
+
 @pytest.mark.integration
 def test_cut_segments_real_ffmpeg_on_sample_vod(tmp_path) -> None:
     """Real ffmpeg test: cut segment from sample VOD if available."""
@@ -21,7 +21,7 @@ def test_local_path_copies_and_writes_json(tmp_path):
 
 
 def test_twitch_url_calls_ytdlp_subprocess_mocked(tmp_path):
-    """Twitch URL triggers yt-dlp subprocess calls for metadata and download."""
+    """Twitch URL triggers one yt-dlp subprocess that downloads and prints metadata."""
     mock_metadata = {
         'title': 'Test VOD',
         'uploader': 'TestStreamer',
@@ -30,9 +30,9 @@ def test_twitch_url_calls_ytdlp_subprocess_mocked(tmp_path):
     }
 
     with mock.patch('backend.vod_download.subprocess.run') as mock_run:
-        # First call returns metadata JSON, second call downloads video
+        # The single call prints the metadata JSON line while downloading the video
         mock_result = mock.Mock()
-        mock_result.stdout = json.dumps(mock_metadata)
+        mock_result.stdout = json.dumps(mock_metadata) + "\n"
         mock_run.return_value = mock_result
 
         # Create the output file so VodAsset can be returned
@@ -44,20 +44,18 @@ def test_twitch_url_calls_ytdlp_subprocess_mocked(tmp_path):
             output_dir=str(tmp_path),
         )
 
-        # Verify subprocess was called twice (metadata + download)
-        assert mock_run.call_count == 2
-        
-        # Check first call is for metadata extraction
-        first_call_args = mock_run.call_args_list[0][0][0]
-        assert first_call_args[0] == 'yt-dlp'
-        assert '--dump-json' in first_call_args
-        assert 'https://www.twitch.tv/videos/1234567890' in first_call_args
-        
-        # Check second call is for download with format selection
-        second_call_args = mock_run.call_args_list[1][0][0]
-        assert second_call_args[0] == 'yt-dlp'
-        assert '-f' in second_call_args  # Format arg present
-        assert 'best[height<=' in second_call_args[second_call_args.index('-f') + 1]
+        # Verify subprocess was called once (metadata + download fused)
+        assert mock_run.call_count == 1
+
+        call_args = mock_run.call_args_list[0][0][0]
+        assert call_args[0] == "yt-dlp"
+        assert "--dump-json" not in call_args
+        assert call_args[call_args.index("--print") + 1].endswith("})j")
+        assert "--no-simulate" in call_args
+        assert call_args[call_args.index("-o") + 1] == str(output_mp4)
+        assert "-f" in call_args  # Format arg present
+        assert "best[height<=" in call_args[call_args.index("-f") + 1]
+        assert "https://www.twitch.tv/videos/1234567890" in call_args
 
         # Verify metadata was written with extracted values
         assert (tmp_path / "vod.json").exists()
@@ -93,7 +91,7 @@ def test_direct_mp4_url_downloads(tmp_path):
     with mock.patch('requests.get') as mock_get:
         mock_response = mock.Mock()
         mock_response.status_code = 200
-        mock_response.content = mock_content
+        mock_response.iter_content.return_value = iter([mock_content[:4], mock_content[4:]])
         mock_get.return_value = mock_response
 
         vod_asset = download_vod(
@@ -103,6 +101,9 @@ def test_direct_mp4_url_downloads(tmp_path):
         assert (tmp_path / "vod.mp4").exists()
         assert (tmp_path / "vod.json").exists()
         assert (tmp_path / "vod.mp4").read_bytes() == mock_content
+        # Streamed rather than buffered whole, and the connection is released
+        assert mock_get.call_args.kwargs["stream"] is True
+        mock_response.close.assert_called_once()
 
 
 def test_direct_mp4_url_failure(tmp_path):
@@ -130,6 +131,18 @@ def test_local_file_copies_content(tmp_path):
     assert (output_dir / "vod.mp4").read_bytes() == content
 
 
+def test_local_file_already_in_output_dir_is_left_intact(tmp_path):
+    """Ingesting output_dir/vod.mp4 itself keeps its bytes (no self-truncating copy)."""
+    content = b"already downloaded"
+    existing = tmp_path / "vod.mp4"
+    existing.write_bytes(content)
+
+    vod_asset = download_vod(str(existing), output_dir=str(tmp_path))
+
+    assert existing.read_bytes() == content
+    assert vod_asset.vod_path == str(existing)
+
+
 def test_metadata_json_structure(tmp_path):
     """Metadata JSON has required structure."""
     local_mp4 = tmp_path / "test.mp4"
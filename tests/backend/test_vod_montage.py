@@ -1,20 +1,62 @@
 """
 Test Plan
 - Partitions: empty paths, all files exist, some files missing, duration selection hits/misses min
-- Boundaries: single clip, multiple clips, zero duration clips, None duration
+- Boundaries: single clip (copied, no ffmpeg), multiple clips, zero duration clips, None duration
 - Failure modes: no valid files, ffmpeg missing, subprocess failure
+- Duration reads: probed concurrently for >2 clips; ffprobe preferred over MoviePy, memoized per (path, mtime, size)
 """
 
+import subprocess
+import threading
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from backend import vod_montage
 from backend.vod_montage import compile_vod_montage, _get_clip_duration
 
 
 # Covers: TODO-VOD-009
 
+# Shared result for stubbed ffmpeg runs; compile_vod_montage never inspects it beyond success.
+_RUN_OK = subprocess.CompletedProcess(args=[], returncode=0)
+
+
+@pytest.fixture(autouse=True)
+def _empty_duration_cache():
+    """Memoized durations must not leak between tests."""
+    vod_montage._cached_clip_duration.cache_clear()
+    yield
+    vod_montage._cached_clip_duration.cache_clear()
+
+
+@pytest.fixture
+def mocked_ffmpeg(monkeypatch) -> list[tuple[list[str], str | None]]:
+    """
+    Stub subprocess.run: write a fake montage to the last argv entry and succeed.
+
+    Returns the recorded (cmd, stdin input) pairs, one per ffmpeg run.
+    """
+    calls: list[tuple[list[str], str | None]] = []
+
+    def mock_run(cmd, **kwargs):
+        calls.append((cmd, kwargs.get("input")))
+        Path(cmd[-1]).write_bytes(b"fake montage")
+        return _RUN_OK
+
+    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
+    return calls
+
+
+def _concat_inputs(stdin_text: str) -> list[str]:
+    """Clip file names listed in a streamed ffconcat script."""
+    return [
+        Path(line[len("file 'file:") : -1]).name
+        for line in stdin_text.splitlines()
+        if line.startswith("file ")
+    ]
+
 
 def test_compile_vod_montage_empty_raises() -> None:
     """compile_vod_montage raises ValueError if segment_paths is empty."""
@@ -31,20 +73,11 @@ def test_compile_vod_montage_no_existing_files_raises(tmp_path) -> None:
         )
 
 
-def test_compile_vod_montage_filters_missing_files(tmp_path, monkeypatch) -> None:
+def test_compile_vod_montage_filters_missing_files(tmp_path, monkeypatch, mocked_ffmpeg) -> None:
     """compile_vod_montage ignores missing files and processes existing ones."""
-    # Mock subprocess to avoid needing ffmpeg
-    def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake montage")
-        result = mock.Mock()
-        result.returncode = 0
-        return result
-
     def mock_get_duration(path):
         return 100.0 if Path(path).exists() else None
 
-    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
     monkeypatch.setattr("backend.vod_montage._get_clip_duration", mock_get_duration)
 
     # Create one real file
@@ -63,22 +96,23 @@ def test_compile_vod_montage_filters_missing_files(tmp_path, monkeypatch) -> Non
     assert Path(output_path).exists()
 
 
-def test_compile_vod_montage_calls_ffmpeg_concat_mocked(tmp_path, monkeypatch) -> None:
-    """compile_vod_montage calls ffmpeg concat with correct arguments."""
-    call_args = []
+def test_compile_vod_montage_ignores_directories(tmp_path, monkeypatch) -> None:
+    """Only regular files count as segments; a directory path is skipped like a missing one."""
+    monkeypatch.setattr("backend.vod_montage._get_clip_duration", lambda _path: 100.0)
+    seg_dir = tmp_path / "segment_000.mp4"
+    seg_dir.mkdir()
 
-    def mock_run(cmd, **kwargs):
-        call_args.append(cmd)
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake montage")
-        result = mock.Mock()
-        result.returncode = 0
-        return result
+    with pytest.raises(ValueError, match="no valid segment files found"):
+        compile_vod_montage([str(seg_dir)], output_path=str(tmp_path / "montage.mp4"))
 
+
+def test_compile_vod_montage_calls_ffmpeg_concat_mocked(
+    tmp_path, monkeypatch, mocked_ffmpeg
+) -> None:
+    """compile_vod_montage calls ffmpeg concat with correct arguments."""
     def mock_get_duration(path):
         return 100.0 if Path(path).exists() else None
 
-    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
     monkeypatch.setattr("backend.vod_montage._get_clip_duration", mock_get_duration)
 
     # Create fake segment files
@@ -95,17 +129,24 @@ def test_compile_vod_montage_calls_ffmpeg_concat_mocked(tmp_path, monkeypatch) -
     )
 
     # Verify ffmpeg was called with concat
-    assert len(call_args) == 1
-    cmd = call_args[0]
+    assert len(mocked_ffmpeg) == 1
+    cmd, stdin_text = mocked_ffmpeg[0]
     assert cmd[0] == "ffmpeg"
     assert "-f" in cmd
     assert "concat" in cmd
     assert "-c" in cmd
     assert "copy" in cmd
     assert output_path in cmd
+    # Concat list is streamed on stdin rather than written to a temp file
+    assert cmd[cmd.index("-i") + 1] == "pipe:0"
+    assert stdin_text.splitlines() == [
+        "ffconcat version 1.0",
+        f"file 'file:{seg1.as_posix()}'",
+        f"file 'file:{seg2.as_posix()}'",
+    ]
 
 
-def test_duration_selection_hits_window(tmp_path, monkeypatch) -> None:
+def test_duration_selection_hits_window(tmp_path, monkeypatch, mocked_ffmpeg) -> None:
     """Duration selection: clips sum to value within [min, max]; stops at min."""
     call_count = 0
 
@@ -119,18 +160,10 @@ def test_duration_selection_hits_window(tmp_path, monkeypatch) -> None:
             return 180.0
         return None
 
-    def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake montage")
-        result = mock.Mock()
-        result.returncode = 0
-        return result
-
     monkeypatch.setattr(
         "backend.vod_montage._get_clip_duration",
         mock_get_duration,
     )
-    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
 
     # Create segment files
     seg1 = tmp_path / "seg1.mp4"
@@ -151,9 +184,10 @@ def test_duration_selection_hits_window(tmp_path, monkeypatch) -> None:
 
     # 180 + 180 + 180 = 540, within [480, 600], stops at min
     assert Path(output_path).exists()
+    assert _concat_inputs(mocked_ffmpeg[0][1]) == ["seg1.mp4", "seg2.mp4", "seg3.mp4"]
 
 
-def test_duration_selection_never_exceeds_max(tmp_path, monkeypatch) -> None:
+def test_duration_selection_never_exceeds_max(tmp_path, monkeypatch, mocked_ffmpeg) -> None:
     """Duration selection: never exceeds max_seconds."""
     def mock_get_duration(path):
         # Return fixed durations
@@ -165,18 +199,10 @@ def test_duration_selection_never_exceeds_max(tmp_path, monkeypatch) -> None:
             return 200.0
         return None
 
-    def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake montage")
-        result = mock.Mock()
-        result.returncode = 0
-        return result
-
     monkeypatch.setattr(
         "backend.vod_montage._get_clip_duration",
         mock_get_duration,
     )
-    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
 
     seg1 = tmp_path / "seg1.mp4"
     seg2 = tmp_path / "seg2.mp4"
@@ -196,28 +222,21 @@ def test_duration_selection_never_exceeds_max(tmp_path, monkeypatch) -> None:
 
     # 300 + 200 = 500, at max (seg3 would exceed, not added)
     assert Path(output_path).exists()
+    assert _concat_inputs(mocked_ffmpeg[0][1]) == ["seg1.mp4", "seg2.mp4"]
 
 
 def test_duration_selection_returns_best_under_max_when_cannot_hit_min(
-    tmp_path, monkeypatch
+    tmp_path, monkeypatch, mocked_ffmpeg
 ) -> None:
     """Duration selection: returns best possible under max if cannot hit min."""
     def mock_get_duration(path):
         # All small clips, cannot hit min=480
         return 100.0
 
-    def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake montage")
-        result = mock.Mock()
-        result.returncode = 0
-        return result
-
     monkeypatch.setattr(
         "backend.vod_montage._get_clip_duration",
         mock_get_duration,
     )
-    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
 
     seg1 = tmp_path / "seg1.mp4"
     seg2 = tmp_path / "seg2.mp4"
@@ -237,9 +256,35 @@ def test_duration_selection_returns_best_under_max_when_cannot_hit_min(
 
     # All clips are 100s, max=500 means only first 5 can fit, but less still ok
     assert Path(output_path).exists()
+    assert _concat_inputs(mocked_ffmpeg[0][1]) == ["seg1.mp4", "seg2.mp4", "seg3.mp4"]
 
 
-def test_compile_vod_montage_skips_none_duration_clips(tmp_path, monkeypatch) -> None:
+def test_compile_vod_montage_probes_durations_concurrently(
+    tmp_path, monkeypatch, mocked_ffmpeg
+) -> None:
+    """With more than two clips, duration probes overlap instead of running one by one."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def mock_get_duration(path):
+        # Only returns once three probes are in flight at the same time.
+        barrier.wait()
+        return 200.0
+
+    monkeypatch.setattr("backend.vod_montage._get_clip_duration", mock_get_duration)
+
+    paths = []
+    for name in ("seg1", "seg2", "seg3"):
+        seg = tmp_path / f"{name}.mp4"
+        seg.write_bytes(b"x")
+        paths.append(str(seg))
+
+    output_path = str(tmp_path / "montage.mp4")
+    assert compile_vod_montage(paths, output_path=output_path) == output_path
+
+
+def test_compile_vod_montage_skips_none_duration_clips(
+    tmp_path, monkeypatch, mocked_ffmpeg
+) -> None:
     """compile_vod_montage skips clips where duration cannot be read."""
     def mock_get_duration(path):
         if "seg1" in path:
@@ -250,18 +295,10 @@ def test_compile_vod_montage_skips_none_duration_clips(tmp_path, monkeypatch) ->
             return 300.0
         return None
 
-    def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake montage")
-        result = mock.Mock()
-        result.returncode = 0
-        return result
-
     monkeypatch.setattr(
         "backend.vod_montage._get_clip_duration",
         mock_get_duration,
     )
-    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
 
     seg1 = tmp_path / "seg1.mp4"
     seg2 = tmp_path / "seg2.mp4"
@@ -281,25 +318,18 @@ def test_compile_vod_montage_skips_none_duration_clips(tmp_path, monkeypatch) ->
 
     # seg2 skipped (None duration), seg1 (200) + seg3 (300) = 500
     assert Path(output_path).exists()
+    assert _concat_inputs(mocked_ffmpeg[0][1]) == ["seg1.mp4", "seg3.mp4"]
 
 
-def test_compile_vod_montage_returns_output_path(tmp_path, monkeypatch) -> None:
+def test_compile_vod_montage_returns_output_path(tmp_path, monkeypatch, mocked_ffmpeg) -> None:
     """compile_vod_montage returns the output_path passed in."""
     def mock_get_duration(path):
         return 100.0
 
-    def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake montage")
-        result = mock.Mock()
-        result.returncode = 0
-        return result
-
     monkeypatch.setattr(
         "backend.vod_montage._get_clip_duration",
         mock_get_duration,
     )
-    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
 
     seg1 = tmp_path / "seg1.mp4"
     seg1.write_bytes(b"1")
@@ -313,23 +343,15 @@ def test_compile_vod_montage_returns_output_path(tmp_path, monkeypatch) -> None:
     assert result == output_path
 
 
-def test_compile_vod_montage_single_clip(tmp_path, monkeypatch) -> None:
+def test_compile_vod_montage_single_clip(tmp_path, monkeypatch, mocked_ffmpeg) -> None:
     """compile_vod_montage works with a single segment clip."""
     def mock_get_duration(path):
         return 500.0
 
-    def mock_run(cmd, **kwargs):
-        output_path = cmd[-1]
-        Path(output_path).write_bytes(b"fake montage")
-        result = mock.Mock()
-        result.returncode = 0
-        return result
-
     monkeypatch.setattr(
         "backend.vod_montage._get_clip_duration",
         mock_get_duration,
     )
-    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
 
     seg1 = tmp_path / "seg1.mp4"
     seg1.write_bytes(b"1")
@@ -346,25 +368,93 @@ def test_compile_vod_montage_single_clip(tmp_path, monkeypatch) -> None:
     assert Path(output_path).exists()
 
 
+def test_compile_vod_montage_single_clip_is_copied_without_ffmpeg(tmp_path, monkeypatch) -> None:
+    """A montage of one selected clip is a byte copy of it; ffmpeg is not spawned."""
+    mock_run = mock.Mock(side_effect=AssertionError("ffmpeg should not run"))
+    monkeypatch.setattr("backend.vod_montage._get_clip_duration", lambda _path: 500.0)
+    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
+
+    seg1 = tmp_path / "seg1.mp4"
+    seg1.write_bytes(b"segment bytes")
+    output_path = str(tmp_path / "montage.mp4")
+
+    assert compile_vod_montage([str(seg1)], output_path=output_path) == output_path
+    assert Path(output_path).read_bytes() == b"segment bytes"
+    mock_run.assert_not_called()
+
+
+def test_compile_vod_montage_single_clip_already_at_output_path(tmp_path, monkeypatch) -> None:
+    """When output_path is the one selected clip, it is returned as-is (no SameFileError)."""
+    mock_run = mock.Mock(side_effect=AssertionError("ffmpeg should not run"))
+    monkeypatch.setattr("backend.vod_montage._get_clip_duration", lambda _path: 500.0)
+    monkeypatch.setattr("backend.vod_montage.subprocess.run", mock_run)
+
+    montage = tmp_path / "montage.mp4"
+    montage.write_bytes(b"segment bytes")
+
+    assert compile_vod_montage([str(montage)], output_path=str(montage)) == str(montage)
+    assert montage.read_bytes() == b"segment bytes"
+    mock_run.assert_not_called()
+
+
 def test_get_clip_duration_returns_none_when_moviepy_unavailable(
+    tmp_path,
     monkeypatch,
 ) -> None:
-    """_get_clip_duration returns None if MoviePy is not available."""
+    """_get_clip_duration returns None if ffprobe fails and MoviePy is not available."""
+    clip = tmp_path / "fake.mp4"
+    clip.write_bytes(b"fake")
+    monkeypatch.setattr("backend.vod_montage.probe_duration_seconds", lambda _path: None)
     monkeypatch.setattr("backend.vod_montage.VideoFileClip", None)
-    result = _get_clip_duration("/tmp/fake.mp4")
+    result = _get_clip_duration(str(clip))
     assert result is None
 
 
-def test_get_clip_duration_returns_none_on_error(monkeypatch) -> None:
-    """_get_clip_duration returns None if VideoFileClip raises."""
+def test_get_clip_duration_returns_none_on_error(tmp_path, monkeypatch) -> None:
+    """_get_clip_duration returns None if ffprobe fails and VideoFileClip raises."""
     def mock_videoclip(*args, **kwargs):
         raise OSError("Cannot open file")
 
+    clip = tmp_path / "fake.mp4"
+    clip.write_bytes(b"fake")
+    monkeypatch.setattr("backend.vod_montage.probe_duration_seconds", lambda _path: None)
     monkeypatch.setattr("backend.vod_montage.VideoFileClip", mock_videoclip)
-    result = _get_clip_duration("/tmp/fake.mp4")
+    result = _get_clip_duration(str(clip))
     assert result is None
 
 
+def test_get_clip_duration_returns_none_for_missing_file() -> None:
+    """_get_clip_duration returns None without probing when the file does not exist."""
+    with mock.patch("backend.vod_montage.probe_duration_seconds") as mock_probe:
+        assert _get_clip_duration("/nonexistent/fake.mp4") is None
+    mock_probe.assert_not_called()
+
+
+def test_get_clip_duration_prefers_ffprobe_and_memoizes(tmp_path, monkeypatch) -> None:
+    """ffprobe is used over MoviePy, and an unchanged file is probed only once."""
+    clip = tmp_path / "segment.mp4"
+    clip.write_bytes(b"fake")
+    mock_probe = mock.Mock(return_value=12.5)
+    monkeypatch.setattr("backend.vod_montage.probe_duration_seconds", mock_probe)
+    monkeypatch.setattr("backend.vod_montage.VideoFileClip", mock.Mock(side_effect=AssertionError))
+
+    assert _get_clip_duration(str(clip)) == pytest.approx(12.5)
+    assert _get_clip_duration(str(clip)) == pytest.approx(12.5)
+    assert mock_probe.call_count == 1
+
+    # Rewriting the clip (new size) invalidates the cached duration.
+    clip.write_bytes(b"rewritten")
+    mock_probe.return_value = 3.0
+    assert _get_clip_duration(str(clip)) == pytest.approx(3.0)
+    assert mock_probe.call_count == 2
+
+
+def test_clip_duration_cache_is_bounded() -> None:
+    """The duration memo is a bounded LRU, not an ever-growing dict."""
+    info = vod_montage._cached_clip_duration.cache_info()
+    assert info.maxsize == vod_montage._DURATION_CACHE_SIZE
+
+
 @pytest.mark.integration
 def test_compile_vod_montage_real_ffmpeg_on_sample_vods(tmp_path) -> None:
     """Real ffmpeg test: compile montage from sample VODs if available."""
@@ -14,6 +14,7 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -54,9 +55,11 @@ def _require_download_and_cut_dependencies() -> None:
 
 
 def _ensure_timestamp_s(chat_path: Path) -> int:
+    """Add timestamp_s from offset_s where missing; rows that already have it stay verbatim."""
     normalized_rows = 0
-    rows: list[str] = []
-    with chat_path.open("r", encoding="utf-8") as handle:
+    with chat_path.open("r", encoding="utf-8") as handle, tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=chat_path.parent, delete=False
+    ) as out:
         for raw_line in handle:
             line = raw_line.strip()
             if not line:
@@ -65,9 +68,14 @@ def _ensure_timestamp_s(chat_path: Path) -> int:
             if "timestamp_s" not in obj and "offset_s" in obj:
                 obj["timestamp_s"] = obj["offset_s"]
                 normalized_rows += 1
-            rows.append(json.dumps(obj, ensure_ascii=False))
-
-    chat_path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+                out.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            else:
+                out.write(line + "\n")
+
+    if normalized_rows:
+        os.replace(out.name, chat_path)
+    else:
+        os.unlink(out.name)
     return normalized_rows
 
 
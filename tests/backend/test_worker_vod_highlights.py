@@ -10,6 +10,7 @@ Covers: TODO-VOD-010
 from __future__ import annotations
 
 import os
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
@@ -18,6 +19,9 @@ from backend.models.jobs import Job
 from backend.models.vod import Segment
 from backend.worker import _default_vod_highlights_handler, default_handlers
 
+# Stand-in for download_vod's VodAsset; the handler only reads these two paths.
+_ASSET = SimpleNamespace(vod_path="/tmp/output/vod.mp4", metadata_path="/tmp/output/vod.json")
+
 
 def test_default_handlers_registers_vod_highlights() -> None:
     """Validation: worker built-ins include vod_highlights handler."""
@@ -29,17 +33,12 @@ def test_vod_highlights_handler_orchestrates_pipeline(monkeypatch: pytest.Monkey
     """Validation: handler runs all stages and returns expected result contract."""
     calls: list[str] = []
 
-    class _Asset:
-        def __init__(self) -> None:
-            self.vod_path = "/tmp/output/vod.mp4"
-            self.metadata_path = "/tmp/output/vod.json"
-
-    def _mock_download(vod_url: str, *, output_dir: str, quality: str = "480p") -> _Asset:
+    def _mock_download(vod_url: str, *, output_dir: str, quality: str = "480p") -> SimpleNamespace:
         calls.append("download")
         assert vod_url == "https://www.twitch.tv/videos/123"
         assert output_dir == "/tmp/output"
         assert quality == "480p"
-        return _Asset()
+        return _ASSET
 
     def _mock_fetch(vod_url_or_id: str, out_path: Any, **kwargs: Any) -> dict[str, Any]:
         calls.append("fetch_chat")
@@ -144,12 +143,7 @@ def test_vod_highlights_handler_uses_local_chat_path_when_provided(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Boundary: local chat_path bypasses Twitch web fetch stage."""
-
-    class _Asset:
-        vod_path = "/tmp/output/vod.mp4"
-        metadata_path = "/tmp/output/vod.json"
-
-    monkeypatch.setattr("backend.vod_download.download_vod", lambda *_args, **_kwargs: _Asset())
+    monkeypatch.setattr("backend.vod_download.download_vod", lambda *_args, **_kwargs: _ASSET)
 
     def _fail_if_called(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
         raise AssertionError("fetch_vod_chat_to_jsonl should not be called with local chat_path")
@@ -186,15 +180,11 @@ def test_vod_highlights_handler_accepts_vod_id(monkeypatch: pytest.MonkeyPatch)
     """Validation: vod_id fallback resolves to Twitch VOD URL for download."""
     seen: dict[str, str] = {}
 
-    class _Asset:
-        vod_path = "/tmp/output/vod.mp4"
-        metadata_path = "/tmp/output/vod.json"
-
-    def _mock_download(vod_url: str, *, output_dir: str, quality: str = "480p") -> _Asset:
+    def _mock_download(vod_url: str, *, output_dir: str, quality: str = "480p") -> SimpleNamespace:
         seen["vod_url"] = vod_url
         seen["output_dir"] = output_dir
         seen["quality"] = quality
-        return _Asset()
+        return _ASSET
 
     monkeypatch.setattr("backend.vod_download.download_vod", _mock_download)
     monkeypatch.setattr(
@@ -7,22 +7,17 @@ Test Plan
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
+from dataclasses import dataclass
 
 import pytest
 
-# Ensure project root is first on path so cli.main resolves.
-_ROOT = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(_ROOT))
-
 from cli.main import main
 
 
+@dataclass(frozen=True, slots=True)
 class _FakeResponse:
-    def __init__(self, payload: dict, status_code: int = 200) -> None:
-        self._payload = payload
-        self.status_code = status_code
+    _payload: dict
+    status_code: int = 200
 
     def json(self) -> dict:
         return self._payload